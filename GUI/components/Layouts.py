@@ -159,6 +159,7 @@ class LayoutBase(WithBlock, Generic[_TWidget], ABC):
 		self._index = 0
 		self._newItems: List[LayoutItemOrWidget] = []
 		self._oldItems: List[LayoutItemOrWidget] = []
+		self._oldItemsById: Optional[dict[Optional[str], List[LayoutItemOrWidget]]] = None  # lazily built by _takeOldItemById(...)
 
 	@abstractmethod
 	def addItem(self, ItemType: TWidgetOrType, initArgs: DictOrTuple = (), onInit: Callable[[_TQWidget], None] = None, isPrefix: bool = False) -> _TWidget:
@@ -184,6 +185,7 @@ class LayoutBase(WithBlock, Generic[_TWidget], ABC):
 		super().__enter__()
 		self._gui.pushLayout(self)
 		self._oldItems = self._collectAllOldItems()
+		self._oldItemsById = None
 		self._newItems = []
 		return self
 
@@ -224,6 +226,23 @@ class LayoutBase(WithBlock, Generic[_TWidget], ABC):
 	def getLastItem(self) -> Optional[LayoutItemOrWidget]:
 		return (self._newItems[-1]) if self._newItems else None
 
+	def _takeOldItemById(self, id_: Optional[str]) -> Optional[LayoutItemOrWidget]:
+		"""
+		removes the first old item whose '__id' attribute equals id_ from the old items and returns it, or None if there is none.
+		"""
+		oldItemsById = self._oldItemsById
+		if oldItemsById is None:
+			oldItemsById = self._oldItemsById = {}
+			for oldItem in self._oldItems:
+				oldItemsById.setdefault(getattr(oldItem, '__id', None), []).append(oldItem)
+
+		itemsForId = oldItemsById.get(id_)
+		if not itemsForId:
+			return None
+		item = itemsForId.pop(0)
+		self._oldItems.remove(item)
+		return item
+
 
 class Layout(LayoutBase[QLayout], ABC):
 	def __init__(self, gui: PythonGUI, qLayout: QLayout, *, forWidget: Optional[QWidget] = None):
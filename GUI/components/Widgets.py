@@ -4,15 +4,15 @@ from math import ceil, inf
 from typing import List, NamedTuple, Optional, TYPE_CHECKING, Tuple, cast, overload
 
 from PyQt5 import sip
-from PyQt5.QtCore import QAbstractTableModel, QEvent, QItemSelection, QItemSelectionModel, QModelIndex, QObject, QPoint, QPointF, QPropertyAnimation, QRect, QRectF, QSize, QSizeF, \
+from PyQt5.QtCore import QAbstractItemModel, QAbstractListModel, QAbstractTableModel, QEvent, QItemSelection, QItemSelectionModel, QModelIndex, QObject, QPoint, QPointF, QPropertyAnimation, QRect, QRectF, QSize, QSizeF, \
 	Qt, pyqtProperty, pyqtSignal
 from PyQt5.QtGui import QAbstractTextDocumentLayout, QBrush, QColor, QCursor, QFocusEvent, QFont, QFontMetrics, QIcon, QKeyEvent, QKeySequence, QMouseEvent, QMoveEvent, QMovie, \
 	QPaintEvent, QPainter, QPainterPath, QPalette, QPen, QPicture, QPixmap, QPolygonF, QResizeEvent, QScreen, QShortcutEvent, QStaticText, QTextDocument, QTextLayout, QTextLine, \
 	QTextOption, QValidator
 from PyQt5.QtWidgets import QAbstractButton, QAbstractItemView, QAbstractSpinBox, QApplication, QCheckBox, QComboBox, QGraphicsBlurEffect, QGraphicsEffect, QGridLayout, QLabel, \
-	QLayout, QLineEdit, QPushButton, QRadioButton, QScrollArea, QShortcut, QSizePolicy, QStyle, QStyleOptionViewItem, QStyledItemDelegate, QTableView, QTextEdit, QTreeView, QWidget
+	QLayout, QLineEdit, QListView, QPushButton, QRadioButton, QScrollArea, QShortcut, QSizePolicy, QStyle, QStyleOptionViewItem, QStyledItemDelegate, QTableView, QTextEdit, QTreeView, QWidget
 
-from ..utilities import connectSafe, safeEmit
+from ..utilities import connectSafe, safeEmit0, safeEmit1, safeEmit2
 from ...GUI.components.catWidgetMixins import CAN_BUT_NO_BORDER_OVERLAP, CORNERS, CatClickableMixin, CatFocusableMixin, CatFramedAbstractScrollAreaMixin, CatFramedAreaMixin, \
 	CatFramedWidgetMixin, CatScalableWidgetMixin, CatSizePolicyMixin, CatStyledWidgetMixin, ColorPalette, OverlapCharacteristics, PaintEventDebug, ShortcutMixin, \
 	UndoBlockableMixin, centerOfRect, getBorderPath, palettes
@@ -468,7 +468,7 @@ class CatElidedLabel(CatClickableMixin, QLabel):
 
 			if didElide != self._isElided:
 				self._isElided = didElide
-				safeEmit(self, self.elisionChanged, didElide)
+				safeEmit1(self, self.elisionChanged, didElide)
 
 
 class CatTextField(CatFocusableMixin, ShortcutMixin, UndoBlockableMixin, CatFramedAreaMixin, QLineEdit, CatSizePolicyMixin, CatStyledWidgetMixin):
@@ -503,12 +503,12 @@ class CatTextField(CatFocusableMixin, ShortcutMixin, UndoBlockableMixin, CatFram
 	@CrashReportWrapped
 	def keyPressEvent(self, event: QKeyEvent):
 		super(CatTextField, self).keyPressEvent(event)
-		safeEmit(self, self.keyPressed, self, event)
+		safeEmit2(self, self.keyPressed, self, event)
 
 	@CrashReportWrapped
 	def event(self, event):
 		if (event.type() == QEvent.KeyPress) and (event.key() == Qt.Key_Tab) and self._capturesTab:
-			safeEmit(self, self.keyPressed, self, event)
+			safeEmit2(self, self.keyPressed, self, event)
 			return True
 		return super(CatTextField, self).event(event)
 
@@ -553,12 +553,12 @@ class CatMultiLineTextField(CatFocusableMixin, ShortcutMixin, UndoBlockableMixin
 	@CrashReportWrapped
 	def keyPressEvent(self, event: QKeyEvent):
 		super().keyPressEvent(event)
-		safeEmit(self, self.keyPressed, self, event)
+		safeEmit2(self, self.keyPressed, self, event)
 
 	@CrashReportWrapped
 	def event(self, event: QEvent) -> bool:
 		if (event.type() == QEvent.KeyPress) and (event.key() == Qt.Key_Tab) and self._capturesTab:
-			safeEmit(self, self.keyPressed, self, event)
+			safeEmit2(self, self.keyPressed, self, event)
 			return True
 		result = super().event(event)
 		return result
@@ -585,6 +585,26 @@ class CatMultiLineTextField(CatFocusableMixin, ShortcutMixin, UndoBlockableMixin
 		return self.getBorderBrush(), self.getBorderBrush2(), QBrush(Qt.NoBrush)
 
 
+class _ChoicesListModel(QAbstractListModel):
+	"""a read-only model, that directly wraps a list of strings, instead of copying every string into a QStandardItem."""
+	def __init__(self, choices: list[str], parent: Optional[QObject] = None):
+		super(_ChoicesListModel, self).__init__(parent)
+		self._choices: list[str] = choices
+
+	def setChoices(self, choices: list[str]) -> None:
+		self.beginResetModel()
+		self._choices = choices
+		self.endResetModel()
+
+	def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self._choices)
+
+	def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+		if (role == Qt.DisplayRole or role == Qt.EditRole) and index.isValid():
+			return self._choices[index.row()]
+		return None
+
+
 class CatComboBox(CatFocusableMixin, ShortcutMixin, UndoBlockableMixin, CatFramedAreaMixin, QComboBox, CatSizePolicyMixin, CatStyledWidgetMixin):
 	"""a QTextField with a keyPressed signal"""
 	def __init__(self, parent: Optional[QWidget] = None):
@@ -595,9 +615,48 @@ class CatComboBox(CatFocusableMixin, ShortcutMixin, UndoBlockableMixin, CatFrame
 		self._roundedCorners = CORNERS.NONE
 		self._colorPalette = palettes.inputColorPalette
 		self._highlightOnFocus = True
+		self._syncedChoices: Optional[list[str]] = None  # the choices last set by a PythonGUI. reset whenever the items change
+		self._connectModelSignals(self.model())
 
 	keyPressed = pyqtSignal(QLineEdit, QKeyEvent)
 
+	def syncedChoices(self) -> Optional[list[str]]:
+		return self._syncedChoices
+
+	def setSyncedChoices(self, choices: Optional[list[str]]) -> None:
+		self._syncedChoices = choices
+
+	LARGE_CHOICES_THRESHOLD: int = 256
+	"""lists with more choices are not copied into the combo box, but wrapped in a list model."""
+
+	def setChoices(self, choices: list[str]) -> None:
+		"""
+		Replaces all items. Large lists of choices are wrapped in a read-only list model instead of being added item by item.
+		Users can't insert new items in that case, even if the combo box is editable.
+		"""
+		model = self.model()
+		if isinstance(model, _ChoicesListModel):
+			model.setChoices(choices)
+		elif len(choices) > self.LARGE_CHOICES_THRESHOLD:
+			self.setModel(_ChoicesListModel(choices, self))
+			if isinstance(view := self.view(), QListView):
+				view.setUniformItemSizes(True)
+		else:
+			self.clear()
+			self.addItems(choices)
+
+	def setModel(self, model: QAbstractItemModel) -> None:
+		super(CatComboBox, self).setModel(model)
+		self._syncedChoices = None
+		self._connectModelSignals(model)
+
+	def _connectModelSignals(self, model: QAbstractItemModel) -> None:
+		for signal in (model.rowsInserted, model.rowsRemoved, model.rowsMoved, model.dataChanged, model.modelReset, model.layoutChanged):
+			connectSafe(signal, self._invalidateSyncedChoices)
+
+	def _invalidateSyncedChoices(self, *args) -> None:
+		self._syncedChoices = None
+
 	def isCapturingTab(self):
 		return self._capturesTab
 
@@ -617,12 +676,12 @@ class CatComboBox(CatFocusableMixin, ShortcutMixin, UndoBlockableMixin, CatFrame
 	@CrashReportWrapped
 	def keyPressEvent(self, event: QKeyEvent):
 		super(CatComboBox, self).keyPressEvent(event)
-		safeEmit(self, self.keyPressed, self, event)
+		safeEmit2(self, self.keyPressed, self, event)
 
 	@CrashReportWrapped
 	def event(self, event):
 		if (event.type()==QEvent.KeyPress) and (event.key()==Qt.Key_Tab) and self._capturesTab:
-			safeEmit(self, self.keyPressed, self, event)
+			safeEmit2(self, self.keyPressed, self, event)
 			return True
 		return super(CatComboBox, self).event(event)
 
@@ -900,7 +959,7 @@ class Int64SpinBox(CatFocusableMixin, ShortcutMixin, UndoBlockableMixin, QAbstra
 			self._updateEdit()
 		self.update()
 		if self.m_value != old:
-			safeEmit(self, self.valueChanged, val)
+			safeEmit1(self, self.valueChanged, val)
 
 	@CrashReportWrapped
 	def stepBy(self, steps: int):
@@ -1964,7 +2023,7 @@ class CatProgressBar(QWidget, CatSizePolicyMixin, CatScalableWidgetMixin, CatSty
 	def setValue(self, value: int) -> None:
 		if self._value != value and value in range(self._minimum, self._maximum+1):
 			self._value = value
-			safeEmit(self, self.valueChanged, value)
+			safeEmit1(self, self.valueChanged, value)
 			self._refresh()
 
 	def reset(self) -> None:
@@ -2348,7 +2407,7 @@ class DataTableModel(QAbstractTableModel):
 		self.beginResetModel()
 		self.endResetModel()
 		# indexes is never empty
-		safeEmit(self, self.selectCell, indexes[0])
+		safeEmit1(self, self.selectCell, indexes[0])
 
 	@CrashReportWrapped
 	def rowCount(self, _=QModelIndex()):
@@ -2417,7 +2476,7 @@ class DataTableModel(QAbstractTableModel):
 			col = 0
 
 		row = min(row, self.rowCount() - 1)
-		safeEmit(self, self.selectCell, self.index(row, col))
+		safeEmit1(self, self.selectCell, self.index(row, col))
 
 		return True
 
@@ -2698,7 +2757,7 @@ class BuilderTreeView(CatFocusableMixin, ShortcutMixin, CatFramedAbstractScrollA
 			data = index.internalPointer().onCut()
 			if data is not None:
 				QApplication.clipboard().setText(data)
-				safeEmit(self, self.dataChanged, )
+				safeEmit0(self, self.dataChanged)
 
 	@CrashReportWrapped
 	def onPaste(self):
@@ -2716,7 +2775,7 @@ class BuilderTreeView(CatFocusableMixin, ShortcutMixin, CatFramedAbstractScrollA
 		if treeItem is not None:
 			data = QApplication.clipboard().text()
 			treeItem.onPaste(data)
-			safeEmit(self, self.dataChanged, )
+			safeEmit0(self, self.dataChanged)
 			sm.emitSelectionChanged(sm.selection(), QItemSelection())
 
 	@CrashReportWrapped
@@ -709,6 +709,9 @@ class CatTabBar(CatFocusableMixin, ShortcutMixin, QWidget, CatSizePolicyMixin, C
 		self._maxTranslation: QPoint = QPoint()
 		self.setMouseTracking(True)
 
+		self._redrawnCount: int = 0  # how often a PythonGUI has drawn this tab bar
+		self._syncedTabOptions: Optional[list[TabOptions]] = None  # the options last set by a PythonGUI. reset whenever the tabs change
+
 		self._updateColorPalette()
 
 	def tabs(self) -> List[Tab]:
@@ -758,7 +761,14 @@ class CatTabBar(CatFocusableMixin, ShortcutMixin, QWidget, CatSizePolicyMixin, C
 			del self._tabs[index]
 			self._onTabsChanged(fireEvent=False)
 
+	def removeTabsFrom(self, index: int):
+		"""removes all tabs starting at index at once."""
+		if self.isValidIndex(index):
+			del self._tabs[index:]
+			self._onTabsChanged(fireEvent=False)
+
 	def _onTabsChanged(self, *, fireEvent: bool) -> None:
+		self._syncedTabOptions = None
 		self._ensureValidIndex(fireEvent=fireEvent, callRefresh=False)
 		self._layoutDirty = True
 		self._refresh()  # self.update() ?
@@ -886,6 +896,9 @@ class CatTabBar(CatFocusableMixin, ShortcutMixin, QWidget, CatSizePolicyMixin, C
 
 	def setTabOptions(self, index: int, options: TabOptions) -> None:
 		if (tab := self._getTab(index)) is not None:
+			if options is tab.options:
+				return
+			self._syncedTabOptions = None
 			optionsChanged = options != tab.options
 			tab.options = options
 			if optionsChanged:
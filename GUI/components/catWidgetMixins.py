@@ -13,7 +13,7 @@ from PyQt5.QtGui import QBrush, QColor, QCursor, QFocusEvent, QFont, QFontMetric
 	QPainterPath, QPalette, QPen, QResizeEvent, QShortcutEvent, QStaticText, qGray
 from PyQt5.QtWidgets import QApplication, QFrame, QLayout, QScrollBar, QShortcut, QSizePolicy, QWidget
 
-from ..utilities import connectSafe, disconnect, safeEmit
+from ..utilities import connectSafe, disconnect, safeEmit1
 from ...utils import Decorator
 from ...utils.profiling import MethodCallCounter
 from ...utils.utils import CrashReportWrapped, runLaterSafe
@@ -262,13 +262,13 @@ class CatClickableMixin:
 
 	@CrashReportWrapped
 	def mouseDoubleClickEvent(self: QWidget, event: QMouseEvent) -> None:
-		safeEmit(self, self.doubleClicked, event)
+		safeEmit1(self, self.doubleClicked, event)
 		event.accept()
 		super(CatClickableMixin, self).mouseDoubleClickEvent(event)
 
 	@CrashReportWrapped
 	def mouseReleaseEvent(self: QWidget, event: QMouseEvent) -> None:
-		safeEmit(self, self.clicked, event)
+		safeEmit1(self, self.clicked, event)
 		event.accept()
 		super(CatClickableMixin, self).mouseReleaseEvent(event)
 
@@ -280,12 +280,12 @@ class CatFocusableMixin:
 	@CrashReportWrapped
 	def focusInEvent(self: QWidget, event: QFocusEvent) -> None:
 		super(CatFocusableMixin, self).focusInEvent(event)
-		safeEmit(self, self.focusReceived, event.reason())
+		safeEmit1(self, self.focusReceived, event.reason())
 
 	@CrashReportWrapped
 	def focusOutEvent(self: QWidget, event: QFocusEvent) -> None:
 		super(CatFocusableMixin, self).focusOutEvent(event)
-		safeEmit(self, self.focusLost, event.reason())
+		safeEmit1(self, self.focusLost, event.reason())
 
 
 _NO_SHORTCUT_ID = 0
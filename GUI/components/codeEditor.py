@@ -38,11 +38,13 @@ class AutoCompletionTree:
 	separator: str
 	nextSeparators: set[str] = field(default_factory=set)
 	_children: OrderedDict[str, AutoCompletionTree] = field(default_factory=OrderedDict)
+	_memberChoicesCache: dict[str, list[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
 
 	def add(self, childName: str, separator: str) -> AutoCompletionTree:
 		qChildName = self.qName + self.separator + childName
 		child = AutoCompletionTree(qChildName, separator)
 		self._children[childName] = child
+		self._memberChoicesCache.clear()
 		if separator:
 			self.nextSeparators.add(separator)
 		return child
@@ -56,6 +58,7 @@ class AutoCompletionTree:
 			child = self.add(childName, separator)
 		elif not child.separator:
 			child.separator = separator
+			self._memberChoicesCache.clear()
 			if separator:
 				self.nextSeparators.add(separator)
 		return child
@@ -88,6 +91,7 @@ class AutoCompletionTree:
 
 		self.nextSeparators = {ch.separator for ch in self._children.values()}
 		self.nextSeparators.discard('')
+		self._memberChoicesCache.clear()
 
 	def addTreeCopy(self, other: AutoCompletionTree) -> AutoCompletionTree:
 		self = replace(self, nextSeparators=self.nextSeparators.copy(), _children=self._children.copy())
@@ -104,6 +108,16 @@ class AutoCompletionTree:
 	def memberItems(self) -> ItemsView[str, AutoCompletionTree]:
 		return self._children.items()
 
+	def memberChoices(self, prefix: str = '') -> list[str]:
+		"""
+		The completion strings of all members, each prepended with prefix.
+		The result is cached until this tree is modified, so it must not be modified by the caller.
+		"""
+		choices = self._memberChoicesCache.get(prefix)
+		if choices is None:
+			choices = self._memberChoicesCache[prefix] = [prefix + member.qName + member.separator[:-1] for member in self._children.values()]
+		return choices
+
 
 def _buildSplitterRegex(delimiters: Iterable[str]):
 	import re
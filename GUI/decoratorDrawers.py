@@ -139,7 +139,12 @@ def drawValidator(gui_: AutoGUI, value_: _TT, type_: Optional[Type[_TT]], decora
 	validator = getValueOrValueOfProp(owner_, decorator_.validator)
 	result: Optional[ValidatorResult] = validator(value_)
 	if result is not None:
-		gui_.helpBox(result.message, style=result.style, hasLabel=kwargs.get('hasLabel', True), enabled=kwargs.get('enabled', True), **decorator_.kwargs)
+		hasLabel = kwargs.get('hasLabel', True)
+		enabled = kwargs.get('enabled', True)
+		if decorator_.kwargs is not None:
+			gui_.helpBox(result.message, style=result.style, hasLabel=hasLabel, enabled=enabled, **decorator_.kwargs)
+		else:
+			gui_.helpBox(result.message, style=result.style, hasLabel=hasLabel, enabled=enabled)
 	return value_
 
 
@@ -243,7 +248,7 @@ def drawToggleSwitch(gui_: AutoGUI, value_: _TT, type_: Optional[Type[_TT]], dec
 def drawComboBox(gui_: AutoGUI, value_: _TT, type_: Optional[Type[_TT]], decorator_: ComboBox, drawProperty_: InnerDrawPropertyFunc[_TT], owner_: SerializableDataclass, **kwargs) -> _TT:
 	return gui_.comboBox(
 		value_,
-		choices=getValueOrValueOfProp(owner_, decorator_.choices),
+		choices=decorator_.resolveChoices(owner_),
 		editable=getValueOrValueOfProp(owner_, decorator_.editable),
 		**kwargs
 	)
@@ -1,5 +1,7 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Any, Callable, Optional, TypeVar, Union, Sequence, Iterable
+from typing import Any, Callable, Optional, TypeVar, Sequence, Iterable
 
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFontDatabase
@@ -39,11 +41,11 @@ class NoUI(PropertyDecorator):
 
 class Range(PropertyDecorator):
 	"""docstring for Range"""
-	def __init__(self, min: Union[int, float], max: Union[int, float], step: Optional[Union[int, float]] = None):
+	def __init__(self, min: int | float, max: int | float, step: Optional[int | float] = None):
 		super().__init__()
-		self.min: Union[int, float] = min
-		self.max: Union[int, float] = max
-		self.step: Optional[Union[int, float]] = step
+		self.min: int | float = min
+		self.max: int | float = max
+		self.step: Optional[int | float] = step
 
 
 class Date(PropertyDecorator):
@@ -106,9 +108,24 @@ class ComboBox(PropertyDecorator):
 	"""docstring for ComboBox"""
 	def __init__(self, choices: Iterable[str] | property, editable: bool | property = False):
 		super().__init__()
-		self.choices = choices
+		# normalize once, so drawers only need a single `is None` check:
+		if isinstance(choices, property):
+			self._choicesProp: Optional[property] = choices
+			self._choicesStatic: Optional[tuple[str, ...]] = None
+		else:
+			self._choicesProp: Optional[property] = None
+			self._choicesStatic: Optional[tuple[str, ...]] = tuple(choices)
 		self.editable: bool = editable
 
+	@property
+	def choices(self) -> Iterable[str] | property:
+		return self._choicesProp if self._choicesProp is not None else self._choicesStatic
+
+	def resolveChoices(self, owner) -> Iterable[str]:
+		"""returns the choices, evaluating the choices property on owner if necessary."""
+		choicesProp = self._choicesProp
+		return self._choicesStatic if choicesProp is None else choicesProp.__get__(owner)
+
 
 class Title(PropertyDecorator):
 	"""docstring for Title"""
@@ -140,7 +157,7 @@ class DescriptionAbove(PropertyDecorator):
 		self.kwargs: dict[str, Any] = kwargs
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)  # read-only display data, never compared.
 class ValidatorResult:
 	message: str
 	style: str
@@ -154,22 +171,28 @@ class Validator(PropertyDecorator):
 	def __init__(self, validator: Callable[[Any], Optional[ValidatorResult]], **kwargs):
 		super().__init__()
 		self.validator: Callable[[Any], Optional[ValidatorResult]] = validator
-		self.kwargs = kwargs
+		self.kwargs: Optional[dict[str, Any]] = kwargs or None  # None if no kwargs were given
+
+
+_FOLDER_NOT_FOUND = ValidatorResult('Folder not found', 'error')
+_NOT_A_DIRECTORY = ValidatorResult('Not a directory', 'error')
+_ILLEGAL_CHARS_MSG = f"Illegal characters: {INVALID_PATH_CHARS}"
+_ILLEGAL_CHARS_RESULT = ValidatorResult(_ILLEGAL_CHARS_MSG, 'error')
 
 
 def folderPathValidator(path: str) -> Optional[ValidatorResult]:
 	import os
 	if not os.path.lexists(path):
-		return ValidatorResult('Folder not found', 'error')
+		return _FOLDER_NOT_FOUND
 
 	if not os.path.isdir(path):
-		return ValidatorResult('Not a directory', 'error')
+		return _NOT_A_DIRECTORY
 	return None
 
 
 def fileNameValidator(name: str) -> Optional[ValidatorResult]:
 	if name and sanitizeFileName(name) != name:
-		return ValidatorResult(f"Illegal characters: {INVALID_PATH_CHARS}", 'error')
+		return _ILLEGAL_CHARS_RESULT
 	return None
 
 
@@ -185,7 +208,7 @@ class Dict(PropertyDecorator):
 		super().__init__()
 
 
-__all__ = [
+__all__ = (
 	'PropertyDecorator',
 	'FolderPath',
 	'FilePath',
@@ -206,4 +229,4 @@ __all__ = [
 	'Validator',
 	'List',
 	'Dict',
-]
\ No newline at end of file
+)
\ No newline at end of file
@@ -6,16 +6,18 @@ import functools as ft
 import itertools
 import math
 import os
+import platform
+import time
 from abc import abstractmethod
 from datetime import date
 from enum import Enum
-from types import EllipsisType
+from types import EllipsisType, MappingProxyType
 from typing import Any, Callable, ClassVar, ContextManager, Generic, Iterable, Iterator, Literal, Optional, Protocol, Sequence, Type, TypeVar, Union, cast, overload
 
 from PyQt5 import QtCore, QtGui, QtWidgets, sip
 from PyQt5.QtCore import QItemSelectionModel, QMargins, QObject, Qt, pyqtBoundSignal, pyqtSignal
 from PyQt5.QtGui import QFont, QFontDatabase, QIcon
-from PyQt5.QtWidgets import QApplication, QDialog, QShortcut, QSizePolicy, QWidget
+from PyQt5.QtWidgets import QApplication, QDialog, QGridLayout, QShortcut, QSizePolicy, QWidget
 
 from ._styles import Style, applyStyle, getStyles
 from .components import codeEditor
@@ -31,17 +33,25 @@ from .components.treeBuilderABC import TreeBuilderABC
 from .components.treeBuilders import DataListBuilder, DataTreeBuilderNode
 from .enums import *
 from .framelessWindow.catFramelessWindowMixin import CatFramelessWindowMixin
-from .utilities import connectOnlyOnce, connectSafe
+from .utilities import connectOnlyOnce, connectSafe, isConnectedOnce
 from ..Serializable.utils import get_args
 from ..utils import DeferredCallOnceMethod, Deprecated
 from ..utils.collections_ import AddToDictDecorator, Stack, getIfKeyIssubclass, getIfKeyIssubclassOrEqual
+from ..utils.logging_ import LogLevel, isEnabledFor
 from ..utils.profiling import ProfiledAction, TimedAction
-from ..utils.utils import CrashReportWrapped
+from ..utils.utils import CrashReportWrapped, runLaterSafe
 
-if not hasattr(QtCore, 'Signal'):
-	QtCore.Signal = QtCore.pyqtSignal
+QtCore.Signal = getattr(QtCore, 'Signal', QtCore.pyqtSignal)
 
-# global variables for debugging:
+# True, if this module is being reloaded (e.g. by importlib.reload(...)). The widget drawer registry is kept in that case,
+# so drawers registered by other modules don't get lost and the default drawers aren't registered twice:
+_MODULE_INITIALIZED: bool = globals().get('_MODULE_INITIALIZED', False)
+
+# redrawLater(...) redraws at most once per interval (in ms, ~ one frame at 60 Hz). An isolated call redraws on the next
+# event loop iteration, calls that arrive within the interval after a redraw are coalesced into one trailing redraw:
+REDRAW_LATER_INTERVAL: int = 16
+
+# global variables for debugging (read on every use, so they can be toggled at runtime):
 ADD_LAYOUT_INFO_AS_TOOL_TIP: bool = False
 PROFILING_ENABLED: bool = False
 
@@ -70,27 +80,78 @@ class GuiDrawerFunc(Protocol[_TT]):
 qEmptyIcon = QtGui.QIcon()
 
 
-__widgetDrawers = dict()
-WidgetDrawer: AddToDictDecorator[Type[_TT], GuiDrawerFunc[_TT]] = AddToDictDecorator[Type[_TT], GuiDrawerFunc[_TT]](__widgetDrawers)
+__widgetDrawers = globals()['__widgetDrawers'] if _MODULE_INITIALIZED else dict()
+_NO_DRAWER = object()  # returned by _resolveWidgetDrawer(...), if getWidgetDrawer(...) has to return its default
+
+
+class _WidgetDrawerDecorator(AddToDictDecorator[Type[_TT], GuiDrawerFunc[_TT]]):
+	"""An AddToDictDecorator, that also invalidates all cached widget drawer lookups."""
+	def __call__(self, key: Type[_TT], *, forceOverride: bool = False, kwargs: dict[str, Any] = None) -> Callable[[GuiDrawerFunc[_TT]], GuiDrawerFunc[_TT]]:
+		addFuncOrClass = super(_WidgetDrawerDecorator, self).__call__(key, forceOverride=forceOverride, kwargs=kwargs)
+
+		def addFuncOrClassAndInvalidate(funcOrClass: GuiDrawerFunc[_TT]) -> GuiDrawerFunc[_TT]:
+			result = addFuncOrClass(funcOrClass)
+			_invalidateWidgetDrawerCache()
+			return result
+		return addFuncOrClassAndInvalidate
+
+
+WidgetDrawer: AddToDictDecorator[Type[_TT], GuiDrawerFunc[_TT]] = _WidgetDrawerDecorator(__widgetDrawers)
+
+
+def _invalidateWidgetDrawerCache() -> None:
+	_resolveWidgetDrawer.cache_clear()
+	_resolveValueFieldDrawer.cache_clear()
 
 
 def addWidgetDrawer(cls: Type[_TT], widgetDrawer: GuiDrawerFunc[_TT]):
 	WidgetDrawer(cls)(widgetDrawer)
 
 
-def getWidgetDrawer(cls: Type[_TT], default: _T2 = None) -> Union[GuiDrawerFunc[_TT], _T2]:
+def _getEnumWidgetDrawer(cls: Type[Enum]) -> Optional[GuiDrawerFunc]:
+	# walk the mro directly, but only consider Enum classes (e.g. skip int for an IntEnum):
+	for subCls in cls.__mro__:
+		if issubclass(subCls, Enum) and (drawer := __widgetDrawers.get(subCls)) is not None:
+			return drawer
+	return None
+
+
+@ft.lru_cache(maxsize=1024)
+def _resolveWidgetDrawer(cls: Type[_TT], hasDefault: bool) -> GuiDrawerFunc[_TT] | object:
 	if issubclass(cls, Enum):
-		enumWidgetDrawers = {type_: drawer for type_, drawer in __widgetDrawers.items() if issubclass(type_, Enum)}
-		if (drawer := getIfKeyIssubclassOrEqual(enumWidgetDrawers, cls, default)) is not None:
+		if (drawer := _getEnumWidgetDrawer(cls)) is not None:
 			return drawer
+		if hasDefault:
+			return _NO_DRAWER
 	result = getIfKeyIssubclassOrEqual(__widgetDrawers, cls, None)
 	if result is None and hasattr(cls, '__origin__'):
 		result = getIfKeyIssubclassOrEqual(__widgetDrawers, cls.__origin__, None)
 	if result is None:
+		result = _NO_DRAWER
+	return result
+
+
+def getWidgetDrawer(cls: Type[_TT], default: _T2 = None) -> Union[GuiDrawerFunc[_TT], _T2]:
+	result = _resolveWidgetDrawer(cls, default is not None)
+	if result is _NO_DRAWER:
 		result = default
 	return result
 
 
+@ft.lru_cache(maxsize=512)
+def _resolveValueFieldDrawer(typeHint: Any) -> Optional[GuiDrawerFunc]:
+	"""resolves the widget drawer for typeHint. For a Union, the first type that has a widget drawer is used."""
+	try:
+		if typeHint.__origin__._name == 'Union':
+			for arg in get_args(typeHint):
+				widgetDrawer = getWidgetDrawer(arg)
+				if widgetDrawer is not None:
+					return widgetDrawer
+	except AttributeError:
+		pass
+	return getWidgetDrawer(typeHint)
+
+
 class Indentation(WithBlock):
 	"""docstring for Indentation"""
 	def __init__(self, gui: PythonGUI):
@@ -154,19 +215,40 @@ class SeamlessQStackedWidget(QtWidgets.QStackedWidget, CatFramedWidgetMixin, Cat
 	def __init__(self, *args):
 		super(SeamlessQStackedWidget, self).__init__(*args)
 		self._overlapCharacteristics: Optional[OverlapCharacteristics] = None
+		self._orderedWidgets: Optional[list[QWidget]] = None
+
+	# the overlapCharacteristics only depend on the current widget, so they only have to be
+	# invalidated if the current widget might change:
 
 	def addWidget(self, w: QWidget) -> int:
-		self._overlapCharacteristics = None
+		if self.count() == 0:
+			self._overlapCharacteristics = None
+		self._orderedWidgets = None
 		return super(SeamlessQStackedWidget, self).addWidget(w)
 
 	def insertWidget(self, index: int, w: QWidget) -> int:
-		self._overlapCharacteristics = None
+		if self.count() == 0:
+			self._overlapCharacteristics = None
+		self._orderedWidgets = None
 		return super(SeamlessQStackedWidget, self).insertWidget(index, w)
 
 	def removeWidget(self, w: QWidget) -> None:
-		self._overlapCharacteristics = None
+		if w is self.currentWidget():
+			self._overlapCharacteristics = None
+		self._orderedWidgets = None
 		return super(SeamlessQStackedWidget, self).removeWidget(w)
 
+	def childEvent(self, event: QtCore.QChildEvent) -> None:
+		# widgets can also be removed by deleting or reparenting them:
+		self._orderedWidgets = None
+		super(SeamlessQStackedWidget, self).childEvent(event)
+
+	def orderedWidgets(self) -> list[QWidget]:
+		"""all widgets in order. The list is cached until widgets are added or removed, so don't modify it."""
+		if (widgets := self._orderedWidgets) is None:
+			widgets = self._orderedWidgets = [self.widget(i) for i in range(self.count())]
+		return widgets
+
 	@property
 	def overlapCharacteristics(self) -> OverlapCharacteristics:
 		if self._overlapCharacteristics is None:
@@ -179,11 +261,9 @@ class SeamlessQStackedWidget(QtWidgets.QStackedWidget, CatFramedWidgetMixin, Cat
 		return self._overlapCharacteristics
 
 	def finalizeBorders(self) -> None:
-		lastIndex = self.count() - 1
 		overlap = self.overlap()
 		corners = self.roundedCorners()
-		for i in range(lastIndex + 1):
-			item = self.widget(i)
+		for item in self.orderedWidgets():
 			finalizeBorders(item, overlap, corners)
 
 
@@ -198,17 +278,21 @@ class StackedControl(LayoutBase[SeamlessQStackedWidget]):
 		selectedViewIdOrNone = getattr(currentSelectedView, '__id', None)
 		return self._getWidget__id(selectedViewIdOrNone, index)
 
+	def _getViewIndicesById(self) -> dict[Optional[str], int]:
+		indicesById = {}
+		for i, widget in enumerate(self._qLayout.orderedWidgets()):
+			indicesById.setdefault(getattr(widget, '__id', None), i)
+		return indicesById
+
 	def _getViewIndexFromId(self, id_: str) -> Optional[int]:
-		stackedWidget = self._qLayout
-		index = next((i for i in range(stackedWidget.count()) if getattr(stackedWidget.widget(i), '__id', None) == id_), None)
-		return index
+		return self._getViewIndicesById().get(id_)
 
 	def _getCurrentlyRequestedViewSelectionIndex(self):
 		return self._getViewIndexFromId(self.selectedView)
 
 	def __exit__(self, exc_type, exc_value, traceback):
 		result = super().__exit__(exc_type, exc_value, traceback)
-		index = self._getViewIndexFromId(self.selectedView)  # = currently requested selection index
+		index = self._getViewIndicesById().get(self.selectedView)  # = currently requested selection index
 		if index is not None:
 			self._setSelectedIndexForWidget(index)
 		return result
@@ -220,8 +304,7 @@ class StackedControl(LayoutBase[SeamlessQStackedWidget]):
 		return False
 
 	def _collectAllOldItems(self) -> list[QWidget]:
-		stackedWidget = self._qLayout
-		return [stackedWidget.widget(i) for i in range(stackedWidget.count())]
+		return list(self._qLayout.orderedWidgets())
 
 	def _removeOldItem(self, item: QWidget) -> None:
 		index = self._qLayout.indexOf(item)
@@ -230,7 +313,7 @@ class StackedControl(LayoutBase[SeamlessQStackedWidget]):
 		# if item is not None:
 		# 	deleteWidget(item)
 
-	def addView(self, id_: Optional[str] = None, preventVStretch: bool = False, preventHStretch: bool = False, seamless: bool = False, *, contentsMargins: Margins = None, **kwargs):
+	def addView(self, id_: Optional[str] = None, preventVStretch: bool = False, preventHStretch: bool = False, seamless: bool = False, *, contentsMargins: Margins = None, guiFunc: Optional[Callable[[PythonGUI], None]] = None, **kwargs):
 		"""
 		Adds a view to the stacked control.
 		:param id_: the id that uniquely identfies the contents of this view within the stacked control.
@@ -239,15 +322,16 @@ class StackedControl(LayoutBase[SeamlessQStackedWidget]):
 		:param preventHStretch:
 		:param seamless:
 		:param contentsMargins:
+		:param guiFunc: if given, draws the contents of the view. It is only called if the view is (going to be) selected or is new,
+				otherwise the view keeps its previous contents. Don't enter the returned layout in that case.
 		:return:
 		"""
 		newIndex = self._index
 		id_ = self._getWidget__id(id_, newIndex)
 		# find view for id:
-		widget = next((view for view in self._oldItems if getattr(view, '__id', None) == id_), None)
+		widget = self._takeOldItemById(id_)
 		# handle old view or create a new view
 		if widget is not None:
-			self._oldItems.remove(widget)
 			oldIndex = self._qLayout.indexOf(widget)
 			if oldIndex != newIndex:
 				self._moveWidget(oldIndex, newIndex, widget)
@@ -257,14 +341,19 @@ class StackedControl(LayoutBase[SeamlessQStackedWidget]):
 			qLayout: Optional[QtWidgets.QGridLayout] = None
 		self._gui.addkwArgsToItem(widget, kwargs)
 		layoutCls = getDoubleColumnLayout(seamless)
-		if type(qLayout) is not layoutCls.QLayoutType:
+		isNew = type(qLayout) is not layoutCls.QLayoutType
+		if isNew:
 			qLayout = layoutCls.QLayoutType()
 			if contentsMargins is not None:
 				qLayout.setContentsMargins(*contentsMargins)
 			widget.setLayout(qLayout)
 
 		self._index += 1
-		return layoutCls(self._gui, qLayout, preventVStretch, preventHStretch, deferBorderFinalization=True, forWidget=widget)
+		layout = layoutCls(self._gui, qLayout, preventVStretch, preventHStretch, deferBorderFinalization=True, forWidget=widget)
+		if guiFunc is not None and (isNew or id_ == self.selectedView):
+			with layout:
+				guiFunc(self._gui)
+		return layout
 
 	def _insertNewWidget(self, newIndex: int, id_: str, widget: Optional[QWidget]) -> QWidget:
 		widget = widget or QWidget()
@@ -288,7 +377,7 @@ class StackedControl(LayoutBase[SeamlessQStackedWidget]):
 
 	@property
 	def selectedView(self) -> str:
-		if self._qLayout != self._gui.modifiedInput[0] and (request := self._selectedViewRequest) is not None:
+		if self._qLayout is not self._gui.modifiedInput[0] and (request := self._selectedViewRequest) is not None:
 			return request
 		else:  # fallback, if _selectedViewRequest could not be found. TODO: maybe add a warning in this case?
 			return self._selectedViewId
@@ -303,6 +392,11 @@ _DEFAULT_TAB_OPTIONS = TabOptions('label')
 class TabControl(StackedControl):
 	def __init__(self, gui: PythonGUI, tabBar: CatTabBar, stackedWidget: SeamlessQStackedWidget, selectedView: Optional[str], *, forWidget: Optional[QWidget] = None):
 		self._tabBar: CatTabBar = tabBar
+		# pre-bound, because these are called for every tab on every redraw:
+		self._setTabOptions = tabBar.setTabOptions
+		self._insertTab = tabBar.insertTab
+		self._moveTab = tabBar.moveTab
+		self._removeTab = tabBar.removeTab
 		super().__init__(gui, stackedWidget, selectedView, forWidget=forWidget)
 
 	def __enter__(self) -> TabControl:
@@ -310,7 +404,7 @@ class TabControl(StackedControl):
 		self._gui._connectOnInputModified(self._tabBar, self._tabBar.currentChanged)
 		return cast(TabControl, result)
 
-	def addTab(self, options: TabOptions, id_: Optional[str] = None, preventVStretch: bool = False, preventHStretch: bool = False, seamless: bool = False, *, contentsMargins: Margins = None, windowPanel: bool = False, **kwargs):
+	def addTab(self, options: TabOptions, id_: Optional[str] = None, preventVStretch: bool = False, preventHStretch: bool = False, seamless: bool = False, *, contentsMargins: Margins = None, windowPanel: bool = False, guiFunc: Optional[Callable[[PythonGUI], None]] = None, **kwargs):
 		"""
 		Adds a Tab to the tab control.
 		:param options: options for the tab (text, toolTip, icon, etc.).
@@ -320,11 +414,13 @@ class TabControl(StackedControl):
 		:param preventHStretch:
 		:param seamless:
 		:param contentsMargins:
+		:param guiFunc: if given, draws the contents of the tab, but only if the tab is selected (or new).
+				Inactive tabs keep their previous contents. Don't enter the returned layout in that case.
 		:return:
 		"""
 		newIndex = self._index
-		layout = super(TabControl, self).addView(id_, preventVStretch, preventHStretch, seamless, contentsMargins=contentsMargins, windowPanel=windowPanel, **kwargs)
-		self._tabBar.setTabOptions(newIndex, options)
+		layout = super(TabControl, self).addView(id_, preventVStretch, preventHStretch, seamless, contentsMargins=contentsMargins, windowPanel=windowPanel, guiFunc=guiFunc, **kwargs)
+		self._setTabOptions(newIndex, options)
 		return layout
 
 	addView = addTab
@@ -335,16 +431,16 @@ class TabControl(StackedControl):
 	def _insertNewWidget(self, newIndex: int, id_: str, widget: Optional[QWidget]) -> QWidget:
 		widget = widget or CatPanel()
 		widget = super(TabControl, self)._insertNewWidget(newIndex, id_, widget)
-		self._tabBar.insertTab(newIndex, _DEFAULT_TAB_OPTIONS)
+		self._insertTab(newIndex, _DEFAULT_TAB_OPTIONS)
 		return widget
 
 	def _moveWidget(self, oldIndex: int, newIndex: int, widget: QWidget) -> None:
-		self._tabBar.moveTab(oldIndex, newIndex)
+		self._moveTab(oldIndex, newIndex)
 		super(TabControl, self)._moveWidget(oldIndex, newIndex, widget)
 
 	def _removeWidget(self, oldIndex: int, widget: QWidget) -> None:
 		super(TabControl, self)._removeWidget(oldIndex, widget)
-		self._tabBar.removeTab(oldIndex)
+		self._removeTab(oldIndex)
 
 	def _selectedIndexFromWidget(self) -> int:
 		return self._tabBar.currentIndex()
@@ -359,46 +455,62 @@ class SeamlessQSplitter(QtWidgets.QSplitter, CatFramedWidgetMixin, CatSizePolicy
 	def __init__(self, *args):
 		super(SeamlessQSplitter, self).__init__(*args)
 		self._overlapCharacteristics: Optional[OverlapCharacteristics] = None
+		self._orderedWidgets: Optional[list[QWidget]] = None
 
 	def insertWidget(self, *args) -> None:
 		super(SeamlessQSplitter, self).insertWidget(*args)
 		self._overlapCharacteristics = None
+		self._orderedWidgets = None
 
 	def addWidget(self, *args) -> None:
 		super(SeamlessQSplitter, self).addWidget(*args)
 		self._overlapCharacteristics = None
+		self._orderedWidgets = None
 
 	def replaceWidget(self, *args) -> QWidget:
 		self._overlapCharacteristics = None
+		self._orderedWidgets = None
 		return super(SeamlessQSplitter, self).replaceWidget(*args)
 
+	def childEvent(self, event: QtCore.QChildEvent) -> None:
+		# widgets can also be removed by deleting or reparenting them:
+		self._orderedWidgets = None
+		super(SeamlessQSplitter, self).childEvent(event)
+
+	def orderedWidgets(self) -> list[QWidget]:
+		"""all widgets in order. The list is cached until widgets are added or removed, so don't modify it."""
+		if (widgets := self._orderedWidgets) is None:
+			widgets = self._orderedWidgets = [self.widget(i) for i in range(self.count())]
+		return widgets
+
 	@property
 	def overlapCharacteristics(self) -> OverlapCharacteristics:
 		if self._overlapCharacteristics is None:
-			count = self.count()
-			if count == 0:
+			widgets = self.orderedWidgets()
+			if not widgets:
 				self._overlapCharacteristics = CANT_AND_NO_OVERLAP
 			else:
+				layouts = [widget.layout() for widget in widgets]
 				if self.orientation() == Qt.Vertical:
-					canReqL = getOverlapCharacteristics2([self.widget(i).layout() for i in range(count)], 0)
-					canReqR = getOverlapCharacteristics2([self.widget(i).layout() for i in range(count)], 2)
-					canReqT = getOverlapCharacteristics2([self.widget(0).layout()], 1)
-					canReqB = getOverlapCharacteristics2([self.widget(count - 1).layout()], 3)
+					canReqL = getOverlapCharacteristics2(layouts, 0)
+					canReqR = getOverlapCharacteristics2(layouts, 2)
+					canReqT = getOverlapCharacteristics2([layouts[0]], 1)
+					canReqB = getOverlapCharacteristics2([layouts[-1]], 3)
 				else:
-					canReqT = getOverlapCharacteristics2([self.widget(i).layout() for i in range(count)], 1)
-					canReqB = getOverlapCharacteristics2([self.widget(i).layout() for i in range(count)], 3)
-					canReqL = getOverlapCharacteristics2([self.widget(0).layout()], 0)
-					canReqR = getOverlapCharacteristics2([self.widget(count - 1).layout()], 2)
+					canReqT = getOverlapCharacteristics2(layouts, 1)
+					canReqB = getOverlapCharacteristics2(layouts, 3)
+					canReqL = getOverlapCharacteristics2([layouts[0]], 0)
+					canReqR = getOverlapCharacteristics2([layouts[-1]], 2)
 				self._overlapCharacteristics = OverlapCharacteristics(canReqL, canReqT, canReqR, canReqB)
 		return self._overlapCharacteristics
 
 	def finalizeBorders(self) -> None:
-		lastIndex = self.count() - 1
+		widgets = self.orderedWidgets()
+		lastIndex = len(widgets) - 1
 		orientation = self.orientation()
 		olp = self.overlap()
 		crn = self.roundedCorners()
-		for i in range(lastIndex + 1):
-			item = self.widget(i)
+		for i, item in enumerate(widgets):
 			if isinstance(item.layout(), CatFramedWidgetMixin):
 				isL = i == 0 or orientation == Qt.Vertical
 				isR = i == lastIndex or orientation == Qt.Vertical
@@ -419,8 +531,7 @@ class SplitterControl(LayoutBase[SeamlessQSplitter]):
 		return False
 
 	def _collectAllOldItems(self) -> list[QWidget]:
-		splitterWidget = self._qLayout
-		return [splitterWidget.widget(i) for i in range(splitterWidget.count())]
+		return list(self._qLayout.orderedWidgets())
 
 	def _removeOldItem(self, item: QWidget) -> None:
 		print("!!!! REMOVING Widget:", item)
@@ -432,10 +543,9 @@ class SplitterControl(LayoutBase[SeamlessQSplitter]):
 		layoutCls = getDoubleColumnLayout(seamless)
 
 		# find widget for id:
-		widget: Optional[QWidget] = next((widget for widget in self._oldItems if getattr(widget, '__id', None) == id_), None)
+		widget: Optional[QWidget] = self._takeOldItemById(id_)
 		# handle old widget or create a new widget
 		if widget is not None:
-			self._oldItems.remove(widget)
 			qLayout = widget.layout()
 		else:
 			widget = QWidget()
@@ -499,8 +609,7 @@ class MenuControl(WithBlock):
 		def executeAction(checked):
 			setter(checked)
 			self._gui.redrawGUI()
-		kwargs.setdefault('checkable', True)
-		kwargs.setdefault('checked', value)
+		kwargs = {'checkable': True, 'checked': value, **kwargs}
 		action = self._addAction(label, kwargs)
 		connectSafe(action.triggered, executeAction)
 
@@ -512,9 +621,18 @@ class MenuControl(WithBlock):
 				item: MenuItemDataLong
 				self.addItem(item[0], item[1], **item[2])
 
+	# exact types, that can be dispatched without going through callable() / isinstance():
+	_ITEM_DISPATCH: ClassVar[dict[type, Callable[..., Any]]] = {
+		list: addMenu,
+		tuple: addMenu,
+	}
+
 	def addItem(self, label: str, value: MenuItemValue, **kwargs):
 		if value is None:  # value is separator
 			return self.addSeparator(label, **kwargs)
+		method = self._ITEM_DISPATCH.get(type(value))
+		if method is not None:
+			return method(self, label, value, **kwargs)
 		if callable(value):  # value is action
 			return self.addAction(label, value, **kwargs)
 		if isinstance(value, Iterable):  # value is menu:
@@ -552,33 +670,261 @@ profiler = ProfiledAction('OnGUI', threshold_percent=1.0, colourNodesBySelftime=
 _redrawRecursionLvl: int = 0
 
 
+class _UpdatesManager:
+	__slots__ = ('_host', '_wasEnabled')
+
+	def __init__(self, host: QWidget):
+		self._host: QWidget = host
+		self._wasEnabled: bool = False
+
+	def __enter__(self):
+		self._wasEnabled = self._host.updatesEnabled()
+		if self._wasEnabled:
+			self._host.setUpdatesEnabled(False)
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		if self._wasEnabled:  # re-enable updates:
+			self._host.setUpdatesEnabled(True)
+
+
+class _RedrawRecursionManager:
+	__slots__ = ('_gui', '_wasDrawing')
+
+	def __init__(self, gui: PythonGUI):
+		self._gui: PythonGUI = gui
+		self._wasDrawing: bool = False
+
+	def __enter__(self):
+		self._wasDrawing = self._gui.isCurrentlyDrawing
+		self._gui.isCurrentlyDrawing = True
+		global _redrawRecursionLvl
+		_redrawRecursionLvl += 1
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		global _redrawRecursionLvl
+		_redrawRecursionLvl -= 1
+		self._gui.isCurrentlyDrawing = self._wasDrawing
+
+
+class _WaitCursorManager:
+	__slots__ = ('_host', '_lastCursor')
+
+	def __init__(self, host: QWidget):
+		self._host: QWidget = host
+		self._lastCursor: Optional[QtGui.QCursor] = None
+
+	def __enter__(self):
+		if self._host.testAttribute(Qt.WA_SetCursor):
+			self._lastCursor = self._host.cursor()
+		else:
+			self._lastCursor = None
+		self._host.setCursor(Qt.WaitCursor)
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		if self._lastCursor is not None:
+			self._host.setCursor(self._lastCursor)
+		else:
+			self._host.unsetCursor()
+
+
+class _OverlayManager:
+	__slots__ = ('_gui', '_wasHidden')
+
+	def __init__(self, gui: PythonGUI):
+		self._gui: PythonGUI = gui
+		self._wasHidden: bool = False
+
+	def __enter__(self):
+		gui = self._gui
+		self._wasHidden = gui._overlay.isHidden()
+		if self._wasHidden:
+			window = gui.host.window()
+			gui._overlay.setParent(window)
+			gui._overlay.setGeometry(window.contentsRect())
+			gui._overlay.raise_()
+			gui._overlay.show()
+			gui.host.setUpdatesEnabled(True)
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		if self._wasHidden:
+			self._gui._overlay.hide()
+
+
+class _RedrawManager:
+	"""
+	The combination of `profiler`, `gui.waitCursor()`, `gui.updatesDisabled()` and `gui._redrawRecursionDepth()`
+	for `PythonGUI._redrawGUI()` in a single context manager. Preallocated once per PythonGUI, because a PythonGUI
+	never redraws recursively.
+	"""
+	__slots__ = ('_gui', '_lastCursor', '_wasEnabled', '_wasDrawing')
+
+	def __init__(self, gui: PythonGUI):
+		self._gui: PythonGUI = gui
+		self._lastCursor: Optional[QtGui.QCursor] = None
+		self._wasEnabled: bool = False
+		self._wasDrawing: bool = False
+
+	def __enter__(self):
+		gui = self._gui
+		host = gui.host
+		profiler.__enter__()
+		try:
+			# waitCursor:
+			self._lastCursor = host.cursor() if host.testAttribute(Qt.WA_SetCursor) else None
+			host.setCursor(Qt.WaitCursor)
+			# updatesDisabled:
+			self._wasEnabled = host.updatesEnabled()
+			if self._wasEnabled:
+				host.setUpdatesEnabled(False)
+		except BaseException as e:
+			profiler.__exit__(type(e), e, e.__traceback__)
+			raise
+		# redrawRecursionDepth:
+		self._wasDrawing = gui.isCurrentlyDrawing
+		gui.isCurrentlyDrawing = True
+		global _redrawRecursionLvl
+		_redrawRecursionLvl += 1
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		gui = self._gui
+		host = gui.host
+		global _redrawRecursionLvl
+		_redrawRecursionLvl -= 1
+		gui.isCurrentlyDrawing = self._wasDrawing
+		try:
+			if self._wasEnabled:  # re-enable updates:
+				host.setUpdatesEnabled(True)
+			if self._lastCursor is not None:
+				host.setCursor(self._lastCursor)
+			else:
+				host.unsetCursor()
+		finally:
+			self._lastCursor = None
+			suppress = profiler.__exit__(exc_type, exc_val, exc_tb)
+		return suppress
+
+
+class _HostEventFilter(QObject):
+	"""
+	Watches the host of a PythonGUI:
+	 - catches up on a redraw, that was skipped while the host was hidden.
+	 - clears cached translations, when the language changes.
+	"""
+	def __init__(self, gui: PythonGUI):
+		super(_HostEventFilter, self).__init__(gui.host)
+		self._gui: PythonGUI = gui
+
+	def eventFilter(self, watched: QObject, event: QtCore.QEvent) -> bool:
+		eventType = event.type()
+		if eventType == QtCore.QEvent.Show:
+			if self._gui._guiDirty:
+				self._gui.redraw('became visible')
+		elif eventType == QtCore.QEvent.LanguageChange:
+			self._gui._buttonTextCache.clear()
+		return False
+
+
+class _LayoutInfoToolTipFilter(QObject):
+	"""shows the layout info tool tip (see PythonGUI.addLayoutInfoAsToolTip) and builds it only when it is requested."""
+	def eventFilter(self, watched: QObject, event: QtCore.QEvent) -> bool:
+		if event.type() == QtCore.QEvent.ToolTip:
+			buildToolTip = getattr(watched, '_PythonGUI__layoutInfoToolTip', None)
+			if buildToolTip is not None:
+				QtWidgets.QToolTip.showText(event.globalPos(), buildToolTip(), watched)
+				return True
+		return False
+
+
+_layoutInfoToolTipFilter: Optional[_LayoutInfoToolTipFilter] = None
+
+
+def _installLayoutInfoToolTipFilter() -> None:
+	global _layoutInfoToolTipFilter
+	if _layoutInfoToolTipFilter is None and (app := QApplication.instance()) is not None:
+		_layoutInfoToolTipFilter = _LayoutInfoToolTipFilter(app)
+		app.installEventFilter(_layoutInfoToolTipFilter)
+
+
+_LAYOUT_INFO_ATTRIBUTES: tuple[str, ...] = (
+	'geometry', 'mapToParent', 'minimumSize', 'minimumSizeHint', 'sizeHint', 'sizePolicy', 'contentsMargins',
+	'viewportMargins', 'contentsRect', 'overlap', 'overlapCharacteristics', 'roundedCorners', 'fontInfo',
+)
+_layoutInfoCapabilities: dict[type, frozenset[str]] = {}
+_SIZE_POLICY_NAMES: dict[int, str] = {policy.value: policy.name for policy in SizePolicy}
+
+
+def _getLayoutInfoCapabilities(cls: type) -> frozenset[str]:
+	"""the attributes in _LAYOUT_INFO_ATTRIBUTES, that cls has. Probed once per type, instead of try / except for every widget."""
+	caps = _layoutInfoCapabilities.get(cls)
+	if caps is None:
+		caps = _layoutInfoCapabilities[cls] = frozenset(name for name in _LAYOUT_INFO_ATTRIBUTES if hasattr(cls, name))
+	return caps
+
+
+_PROP_KIND_STYLE = 'style'
+_PROP_KIND_EVENT = 'event'
+_PROP_KIND_PROPERTY = 'property'
+_PROP_KINDS: dict[str, str] = {'style': _PROP_KIND_STYLE}  # filled lazily by _classifyProp(...)
+
+
+def _classifyProp(propName: str) -> str:
+	if propName.startswith('on') and len(propName) > 2 and propName[2].isupper():
+		kind = _PROP_KIND_EVENT
+	else:
+		kind = _PROP_KIND_PROPERTY
+	_PROP_KINDS[propName] = kind
+	return kind
+
+
 def _connectEventListener(item: QObject, propName: str, value: Any):
+	# keep track of the connected listeners on the python side, so we don't have to ask Qt for the receivers of the event:
+	connectedListeners: Optional[dict[str, tuple[Callable, QtCore.QMetaObject.Connection]]] = getattr(item, '__catEventListeners', None)
+	if connectedListeners is None:
+		connectedListeners = {}
+		setattr(item, '__catEventListeners', connectedListeners)
+
+	old = connectedListeners.get(propName)
+	if old is not None and old[0] is value:
+		return  # already connected.
+
 	eventName = propName[2].lower() + propName[3:]
 	event = getattr(item, eventName)
-	receivers = QtCore.QObject.receivers(item, event)
-	if receivers == 1:
-		event.disconnect()
-	elif receivers > 1:
-		raise AttributeError('too many receivers connected to signal. only one (1) is allowed.')
-	connectSafe(event, value)
+	if old is not None:
+		event.disconnect(old[1])
+	connectedListeners[propName] = (value, connectSafe(event, value))
 
 
 _SHORTCUT_SETTERS: dict[str, Callable[[QObject, KeySequenceLike, dict[str, Any]], bool]] = {}
 _shortcutSetter = AddToDictDecorator(_SHORTCUT_SETTERS)
 
 
+_PROP_ACCESSOR_CACHE: dict[tuple[type, str, bool], tuple[Callable[[QObject], Any], Callable[..., None]]] = {}
+
+
+def _getPropAccessors(itemType: type, propName: str, isBool: bool) -> tuple[Callable[[QObject], Any], Callable[..., None]]:
+	"""
+	returns the unbound (getter, setter) pair for the property propName of itemType.
+	:raises AttributeError: if itemType has no such property.
+	"""
+	key = (itemType, propName, isBool)
+	accessors = _PROP_ACCESSOR_CACHE.get(key)
+	if accessors is None:
+		name = propName[0].upper() + propName[1:len(propName)]
+		getName = 'is' + name if (isBool and not hasattr(itemType, propName)) else propName
+		accessors = _PROP_ACCESSOR_CACHE[key] = (getattr(itemType, getName), getattr(itemType, 'set' + name))
+	return accessors
+
+
 def _setQObjectPropertySimple(item: QObject, propName: str, value: Any) -> None:
-	name = propName[0].upper() + propName[1:len(propName)]
-	getName = 'is' + name if (type(value) is bool and not hasattr(item, propName)) else propName
-	if getattr(item, getName)() != value:
-		setter = getattr(item, 'set' + name)
+	getter, setter = _getPropAccessors(type(item), propName, type(value) is bool)
+	if getter(item) != value:
 		if type(value) is tuple:
 			try:
-				setter(*value)
+				setter(item, *value)
 			except TypeError:
-				setter(value)
+				setter(item, value)
 		else:
-			setter(value)
+			setter(item, value)
 
 
 def _setQWidgetShortcut(item: QObject, key: KeySequenceLike, kwargs: dict[str, Any], *, defaultParentDepth: int, shortcutContext: Qt.ShortcutContext) -> bool:
@@ -599,7 +945,13 @@ _shortcutSetter('shortcut', kwargs=dict(defaultParentDepth=0, shortcutContext=Qt
 _shortcutSetter('parentShortcut', kwargs=dict(defaultParentDepth=1, shortcutContext=Qt.WidgetWithChildrenShortcut))(_setQWidgetShortcut)
 
 
+# (type, propName) pairs, that have no Qt property of that name and must always use the shortcut setter:
+_SHORTCUT_ONLY_PROPS: set[tuple[type, str]] = set()
+
+
 def _setQObjectProperty(item: QObject, propName: str, value: Any, kwargs: dict[str, Any]) -> bool:
+	if (type(item), propName) in _SHORTCUT_ONLY_PROPS:
+		return _SHORTCUT_SETTERS[propName](item, value, kwargs)
 	# value is just a plain value:
 	try:
 		_setQObjectPropertySimple(item, propName, value)
@@ -608,10 +960,81 @@ def _setQObjectProperty(item: QObject, propName: str, value: Any, kwargs: dict[s
 		shortcutSetter = _SHORTCUT_SETTERS.get(propName)
 		if shortcutSetter is None:
 			raise
+		_SHORTCUT_ONLY_PROPS.add((type(item), propName))
 		hasShortcut = shortcutSetter(item, value, kwargs)
 	return hasShortcut
 
 
+# dynamic Qt property, that marks selection models whose selectionChanged signal is already connected to OnInputModified(...):
+_ON_INPUT_MODIFIED_CONNECTED_PROPERTY: str = '_PythonGUI__onInputModifiedConnected'
+
+# shared, immutable empty kwargs, so no new dict has to be created for each call:
+_EMPTY_KWARGS: MappingProxyType[str, Any] = MappingProxyType({})
+
+# on Linux, QFileDialog.getSaveFileName doesn't add the file extension (see showFileDialog(...)):
+_IS_LINUX: bool = platform.system().lower() == "linux"
+
+
+def _toFilterStr(fileFilter: FileExtensionFilter) -> str:
+	extensionList = fileFilter[1] if isinstance(fileFilter[1], str) else " *".join(fileFilter[1])
+	return f"{fileFilter[0]}, (*{extensionList})"
+
+
+_fontDatabase: Optional[QFontDatabase] = None
+
+
+def _getFontDatabase() -> QFontDatabase:
+	# created lazily, because a QFontDatabase requires a QApplication:
+	global _fontDatabase
+	if _fontDatabase is None:
+		_fontDatabase = QFontDatabase()
+	return _fontDatabase
+
+
+@ft.lru_cache(maxsize=32)
+def _getFontFamilies(writingSystem: QFontDatabase.WritingSystem) -> tuple[str, ...]:
+	# enumerating all fonts is slow, so the result is cached until the font database changes (see clearFontFamilyCache()):
+	app = QApplication.instance()
+	if (fontDatabaseChanged := getattr(app, 'fontDatabaseChanged', None)) is not None:
+		connectOnlyOnce(app, fontDatabaseChanged, clearFontFamilyCache, '_clearFontFamilyCache_')
+	return tuple(_getFontDatabase().families(writingSystem))
+
+
+def clearFontFamilyCache() -> None:
+	"""must be called after fonts have been added to or removed from the QFontDatabase (e.g.: QFontDatabase.addApplicationFont(...))"""
+	_getFontFamilies.cache_clear()
+
+
+@ft.lru_cache(maxsize=256)
+def _getEnumChoices(enumCls: Type[Enum]) -> tuple[tuple[str, ...], tuple[Enum, ...], dict[Enum, int]]:
+	"""returns the names and members (including aliases) of enumCls, and the index of the first name of every member."""
+	names = tuple(enumCls.__members__.keys())
+	members = tuple(enumCls.__members__.values())
+	indexByMember = {}
+	for i, member in enumerate(members):
+		indexByMember.setdefault(member, i)
+	return names, members, indexByMember
+
+
+def _defaultValueFieldGuiFunc(gui: PythonGUI, v: _TT, **kwargs) -> _TT:
+	return gui.valueField(v, **kwargs)
+
+
+def _redrawSubGUIOnInit(w: PythonGUIWidget) -> None:
+	w._gui.redrawGUI()
+
+
+class _RedrawSubGUIAfterOnInit:
+	"""onInit for subGUI(...), that calls the user supplied onInit first and then redraws the sub gui."""
+	__slots__ = ('onInit',)
+
+	def __init__(self, onInit: Callable[[PythonGUIWidget], Any]):
+		self.onInit = onInit
+
+	def __call__(self, w: PythonGUIWidget) -> None:
+		self.onInit(w) or w._gui.redrawGUI()
+
+
 @dataclasses.dataclass(init=False, repr=False, eq=False)
 class PythonGUI(CatScalableWidgetMixin):
 	"""docstring for PythonGUI
@@ -644,6 +1067,7 @@ class PythonGUI(CatScalableWidgetMixin):
 
 	customData: dict[str, Any]  # for the user of this PythonGUI instance to store custom data
 	host: QWidget
+	_hostDeleted: bool  # set by host.destroyed, so we don't have to ask sip.isdeleted(...) every time
 	OnGUI: Callable[[_TS], None]
 	isCurrentlyDrawing: bool
 	_widgetStack: Stack[LayoutBase]
@@ -660,18 +1084,36 @@ class PythonGUI(CatScalableWidgetMixin):
 	_modifiedInputStack: Stack[ModifiedInput]  # for handling recursive OnInputModified calls, don't remove!
 	_buttonGroups: dict[Union[str, int], QtWidgets.QButtonGroup]
 	_forceSecondRedraw: bool
+	_pendingRedrawCauses: Optional[list[Optional[str]]]  # None, if no redrawLater is scheduled
+	_lastRedrawLaterTime: float  # time.perf_counter() of the last redraw triggered by redrawLater
 	_firstTabWidget: Optional[QWidget]
 	_lastTabWidget: Optional[QWidget]
+	_tabOrderWidgets: list[QWidget]  # all focusable widgets in tab order, collected during a redraw
 	_lastWidget: Optional[QWidget]
+	_hasBeenDrawn: bool
+	_lastHostStyle: Optional[Style]  # the hostWidgetStyle, that was applied during the last redraw
+	_redrawManager: _RedrawManager
+	_buttonTextCache: dict[MessageBoxButton, str]  # see getDefaultButtonText(...)
+	_guiDirty: bool  # a redraw was skipped, because the host was hidden
 
 	_isFirstRedraw: bool
 	_isLastRedraw: bool
 	_name: str
 
+	# scaled sizes, cached until the scale changes:
+	_cachedMargin: Optional[int]
+	_cachedSmallPanelMargin: Optional[int]
+	_cachedSpacing: Optional[int]
+	_cachedSmallSpacing: Optional[int]
+	_cachedIndentWidth: Optional[float]
+	_cachedQBoxMargins: Optional[QMargins]
+
 	def __init__(self: _TS, host: QWidget, OnGUI: Callable[[_TS], None], *, seamless: bool = False, deferBorderFinalization: bool = False, suppressRedrawLogging: bool = False, style: Style = None):
 		super(PythonGUI, self).__init__()
 		self.customData = {}  # for the user of this PythonGUI instance to store custom data
 		self.host = host
+		self._hostDeleted = False
+		connectSafe(host.destroyed, lambda *_: setattr(self, '_hostDeleted', True))
 		self.OnGUI = OnGUI
 		self.isCurrentlyDrawing = False
 		self._widgetStack: Stack[LayoutBase] = Stack()
@@ -698,13 +1140,23 @@ class PythonGUI(CatScalableWidgetMixin):
 		self._modifiedInputStack = Stack()  # for handling recursive OnInputModified calls, don't remove!
 		self._buttonGroups = {}
 		self._forceSecondRedraw = False
+		self._pendingRedrawCauses = None
+		self._lastRedrawLaterTime = -math.inf
 		self._firstTabWidget = None
 		self._lastTabWidget = None
 		self._lastWidget = None
+		self._tabOrderWidgets = []
+		self._hasBeenDrawn = False
+		self._lastHostStyle = None
+		self._redrawManager = _RedrawManager(self)
+		self._guiDirty = False
+		self._buttonTextCache = {}
+		host.installEventFilter(_HostEventFilter(self))
 
 		self._isFirstRedraw = True
 		self._isLastRedraw = True
 		self._name = ''
+		self._invalidateScaleCache()
 
 	@property
 	def name(self) -> str:
@@ -724,6 +1176,11 @@ class PythonGUI(CatScalableWidgetMixin):
 	def _logNPrint(self, msg: str, *, forceLog: bool = True) -> None:
 		TimedAction.logNPrint(msg, doPrint=not self.suppressRedrawLogging, doLog=forceLog or not self.suppressRedrawLogging)
 
+	@property
+	def _isLogNPrintEnabled(self) -> bool:
+		"""False, if _logNPrint(...) would neither print nor log. Check before building expensive log messages."""
+		return not self.suppressRedrawLogging or isEnabledFor(LogLevel.DEBUG)
+
 	def timedAction(self, msg: str, *, details: str = '', forceLog: bool = True) -> TimedAction:
 		return TimedAction(msg, details=details, doPrint=not self.suppressRedrawLogging, doLog=forceLog or not self.suppressRedrawLogging)
 
@@ -737,7 +1194,7 @@ class PythonGUI(CatScalableWidgetMixin):
 		return None
 
 	def updateGeometry(self):
-		if not sip.isdeleted(self.host):
+		if not self._hostDeleted:
 			self.host.updateGeometry()
 
 	@property
@@ -748,32 +1205,63 @@ class PythonGUI(CatScalableWidgetMixin):
 	def panelMargins(self) -> int:
 		return self.margin
 
+	def updateScaleFromFontMetrics(self, font: QFont = None) -> None:
+		oldScale = self._scale
+		super(PythonGUI, self).updateScaleFromFontMetrics(font)
+		if self._scale != oldScale:
+			self._invalidateScaleCache()
+
+	def _invalidateScaleCache(self) -> None:
+		self._cachedMargin = None
+		self._cachedSmallPanelMargin = None
+		self._cachedSpacing = None
+		self._cachedSmallSpacing = None
+		self._cachedIndentWidth = None
+		self._cachedQBoxMargins = None
+
+	@property
+	def _indentWidth(self) -> float:
+		"""width of a single indentation level (unrounded)"""
+		if (width := self._cachedIndentWidth) is None:
+			width = self._cachedIndentWidth = 17 * self._scale
+		return width
+
 	@property
 	def margin(self) -> int:
-		return int(9 * self._scale)
+		if (margin := self._cachedMargin) is None:
+			margin = self._cachedMargin = int(9 * self._scale)
+		return margin
 
 	@property
 	def smallPanelMargin(self) -> int:
-		return int(4 * self._scale)
+		if (margin := self._cachedSmallPanelMargin) is None:
+			margin = self._cachedSmallPanelMargin = int(4 * self._scale)
+		return margin
 
 	@property
 	def spacing(self) -> int:
-		return int(9 * self._scale)
+		if (spacing := self._cachedSpacing) is None:
+			spacing = self._cachedSpacing = int(9 * self._scale)
+		return spacing
 
 	@property
 	def smallSpacing(self) -> int:
-		return int(6 * self._scale)
+		if (spacing := self._cachedSmallSpacing) is None:
+			spacing = self._cachedSmallSpacing = int(6 * self._scale)
+		return spacing
 
 	@property
 	def qBoxMargins(self) -> QMargins:
-		mg = 6
-		mg = int(round(mg * self._scale))
-		return QMargins(
-			mg,
-			mg,
-			mg,
-			mg,
-		)
+		if (margins := self._cachedQBoxMargins) is None:
+			mg = 6
+			mg = int(round(mg * self._scale))
+			margins = self._cachedQBoxMargins = QMargins(
+				mg,
+				mg,
+				mg,
+				mg,
+			)
+		return margins
 
 	@property
 	def isFirstRedraw(self) -> bool:
@@ -796,80 +1284,30 @@ class PythonGUI(CatScalableWidgetMixin):
 		return self._lastWidget
 
 	def updatesDisabled(self) -> ContextManager[None]:
-		gui = self
-
-		class UpdatesManager:
-			def __enter__(self):
-				self._wasEnabled = gui.host.updatesEnabled()
-				if self._wasEnabled:
-					gui.host.setUpdatesEnabled(False)
-
-			def __exit__(self, exc_type, exc_val, exc_tb):
-				if self._wasEnabled:  # re-enable updates:
-					gui.host.setUpdatesEnabled(True)
-		return UpdatesManager()
+		return _UpdatesManager(self.host)
 
 	def _redrawRecursionDepth(self) -> ContextManager[None]:
 		# TODO: find better name for PythonGUI._redrawRecursionDepth(...)
-		gui = self
-
-		class RedrawRecursionManager:
-			def __enter__(self):
-				self._wasDrawing = gui.isCurrentlyDrawing
-				gui.isCurrentlyDrawing = True
-				global _redrawRecursionLvl
-				_redrawRecursionLvl += 1
-
-			def __exit__(self, exc_type, exc_val, exc_tb):
-				global _redrawRecursionLvl
-				_redrawRecursionLvl -= 1
-				gui.isCurrentlyDrawing = self._wasDrawing
-		return RedrawRecursionManager()
+		return _RedrawRecursionManager(self)
 
 	def waitCursor(self) -> ContextManager[None]:
-		gui = self
-
-		class WaitCursorManager:
-			def __enter__(self):
-				if gui.host.testAttribute(Qt.WA_SetCursor):
-					self._lastCursor = gui.host.cursor()
-				else:
-					self._lastCursor = None
-				gui.host.setCursor(Qt.WaitCursor)
-
-			def __exit__(self, exc_type, exc_val, exc_tb):
-				if self._lastCursor is not None:
-					gui.host.setCursor(self._lastCursor)
-				else:
-					gui.host.unsetCursor()
-		return WaitCursorManager()
+		return _WaitCursorManager(self.host)
 
 	def overlay(self) -> ContextManager[None]:
-		gui = self
-
-		class OverlayManager:
-			def __enter__(self):
-				self._wasHidden = gui._overlay.isHidden()
-				if self._wasHidden:
-					window = gui.host.window()
-					gui._overlay.setParent(window)
-					gui._overlay.setGeometry(window.contentsRect())
-					gui._overlay.raise_()
-					gui._overlay.show()
-					gui.host.setUpdatesEnabled(True)
-
-			def __exit__(self, exc_type, exc_val, exc_tb):
-				if self._wasHidden:
-					gui._overlay.hide()
-		return OverlayManager()
+		return _OverlayManager(self)
 
 	def _redrawGUI(self) -> None:
-		applyStyle(self.host, getStyles().hostWidgetStyle)  # + styles.layoutingBorder)
+		# comparing the Styles is cheaper than building the style sheet string and fetching the current one from Qt:
+		if (style := getStyles().hostWidgetStyle) != self._lastHostStyle:
+			applyStyle(self.host, style)  # + styles.layoutingBorder)
+			self._lastHostStyle = style
 		global PROFILING_ENABLED
 		global profiler
 		if self.isCurrentlyDrawing:
 			return
 
+		self._hasBeenDrawn = True
+		self._guiDirty = False
 		with self.timedAction('redrawing GUI', details=self.loggingIdentifier):
 			# prepare _widgetStack:
 			assert len(self._widgetStack) == 0, f"len(self._widgetStack) = {len(self._widgetStack)}"
@@ -877,16 +1315,25 @@ class PythonGUI(CatScalableWidgetMixin):
 			self._firstTabWidget = None
 			self._lastTabWidget = None
 			self._lastWidget = None
+			self._tabOrderWidgets = []
 
 			profiler.enabled = PROFILING_ENABLED
 			if profiler.enabled:
 				self._logNPrint(f"Profiling...")
 			self.updateScaleFromFontMetrics()
 			# draw GUI:
-			with profiler, self.waitCursor(), self.updatesDisabled(), self._redrawRecursionDepth():
+			with self._redrawManager:
 				with self.currentLayout:
 					self.OnGUI(self)
 				assert len(self._widgetStack) == 0
+				self._applyTabOrder()
+
+	def _applyTabOrder(self) -> None:
+		tabOrderWidgets = self._tabOrderWidgets
+		self._tabOrderWidgets = []
+		setTabOrder = QWidget.setTabOrder
+		for first, second in zip(tabOrderWidgets, tabOrderWidgets[1:]):
+			setTabOrder(first, second)
 
 	@CrashReportWrapped
 	def redraw(self, cause: Optional[str] = None) -> None:
@@ -894,7 +1341,11 @@ class PythonGUI(CatScalableWidgetMixin):
 			return
 		if self.isCurrentlyDrawing:
 			return
-		if cause is not None:
+		if self._hasBeenDrawn and not self.host.isVisible():
+			# postpone until the host is shown again. The first redraw always happens, so sizeHints are correct when showing:
+			self._guiDirty = True
+			return
+		if cause is not None and self._isLogNPrintEnabled:
 			logMessage = f"redraw caused by: {cause}"
 			self._logNPrint(logMessage)
 		self._redrawGUI()
@@ -905,18 +1356,29 @@ class PythonGUI(CatScalableWidgetMixin):
 	redrawGUI = redraw
 
 	def redrawLater(self, cause: Optional[str] = None) -> None:
-		logMessage = f"scheduling redrawLater for {self.loggingIdentifier}"
-		if cause is not None:
-			logMessage = f"{logMessage}; cause = {cause}"
-		self._logNPrint(logMessage)
-		self._redrawLater(cause)
+		if self._isLogNPrintEnabled:
+			logMessage = f"scheduling redrawLater for {self.loggingIdentifier}"
+			if cause is not None:
+				logMessage = f"{logMessage}; cause = {cause}"
+			self._logNPrint(logMessage)
+		# throttle (leading + trailing): redraw on the next tick, unless the last redraw was less than REDRAW_LATER_INTERVAL
+		# ago. In that case, all calls until the interval has passed result in a single redraw:
+		if self._pendingRedrawCauses is None:
+			self._pendingRedrawCauses = [cause]
+			elapsedMs = (time.perf_counter() - self._lastRedrawLaterTime) * 1000
+			delay = 0 if elapsedMs >= REDRAW_LATER_INTERVAL else math.ceil(REDRAW_LATER_INTERVAL - elapsedMs)
+			runLaterSafe(delay, Qt.PreciseTimer, self._redrawLater)
+		else:
+			self._pendingRedrawCauses.append(cause)
 
-	@DeferredCallOnceMethod(delay=0)
-	def _redrawLater(self, cause: Optional[str] = None) -> None:
-		if self.host is None or sip.isdeleted(self.host):
+	def _redrawLater(self) -> None:
+		causes = self._pendingRedrawCauses
+		self._pendingRedrawCauses = None
+		self._lastRedrawLaterTime = time.perf_counter()
+		if self.host is None or self._hostDeleted:
 			return
-		if cause is not None:
-			logMessage = f"redrawLater caused by: {cause}"
+		if self._isLogNPrintEnabled and (causes := [cause for cause in causes if cause is not None]):
+			logMessage = f"redrawLater caused by: {', '.join(causes)}"
 			self._logNPrint(logMessage)
 		self.redraw()
 
@@ -932,33 +1394,48 @@ class PythonGUI(CatScalableWidgetMixin):
 			self._modifiedInputStack.push(self.modifiedInput)
 			self.modifiedInput = (modifiedWidget, data)
 			if not self.isCurrentlyDrawing:
-				self._logNPrint(f'modifiedInput = {self.modifiedInput}')
+				if self._isLogNPrintEnabled:
+					self._logNPrint(f'modifiedInput = {self.modifiedInput}')
 				self._isFirstRedraw = True
 				self._isLastRedraw = False
 				self._redrawGUI()
 		finally:
 			self.modifiedInput = self._modifiedInputStack.pop()
 		if not self._modifiedInputStack and self._forceSecondRedraw:
-			self._forceSecondRedraw = False
-			self._isFirstRedraw = False
-			self._isLastRedraw = True
-			self._redrawGUI()  # redraw again!
+			# redraw again, but only once for all inputs modified during this event loop iteration:
+			self._secondRedraw()
 		self._isFirstRedraw = True
 		self._isLastRedraw = True
 
+	@DeferredCallOnceMethod(delay=0)
+	def _secondRedraw(self) -> None:
+		if not self._forceSecondRedraw or self._hostDeleted:
+			return
+		self._forceSecondRedraw = False
+		self._isFirstRedraw = False
+		self._isLastRedraw = True
+		try:
+			self._redrawGUI()
+		finally:
+			self._isFirstRedraw = True
+			self._isLastRedraw = True
+
 	def _connectOnInputModified(self, widget: QWidget | QtWidgets.QLayout, signal: pyqtBoundSignal | pyqtSignal):
 		# pyqtSignal is in the type signature, only to make pycharms typechecker happy.
-		connectOnlyOnce(widget, signal, lambda _=None: self.OnInputModified(widget), '_OnInputModified_')
+		# check first, so we don't create a new lambda for every widget on every redraw:
+		if not isConnectedOnce(widget, signal, '_OnInputModified_'):
+			connectOnlyOnce(widget, signal, lambda _=None: self.OnInputModified(widget), '_OnInputModified_')
 
 	def handleKWArgsCache(self, item, kwargs):
 		if not kwargs:
 			return True
-		kwargsTuple = tuple(kwargs.items())
-		allKwArgs = getattr(item, '_PythonGUI__allKwArgs', ())
-		if allKwArgs == kwargsTuple:
+		# compare the dicts directly, so nothing has to be allocated in the (common) unchanged case:
+		allKwArgs = getattr(item, '_PythonGUI__allKwArgs', None)
+		if allKwArgs is not None and allKwArgs == kwargs:
 			return True
 		else:
-			setattr(item, '_PythonGUI__allKwArgs', kwargsTuple)
+			# copy, because kwargs get consumed while being applied:
+			setattr(item, '_PythonGUI__allKwArgs', dict(kwargs))
 		return False
 
 	def handleBasicKwArgs(self, item, kwargs):
@@ -974,63 +1451,54 @@ class PythonGUI(CatScalableWidgetMixin):
 			pass
 
 	def addLayoutInfoAsToolTip(self, item: QWidget, kwargs: dict[str, Any]) -> dict[str, Any]:
-		infos: list[str] = []
-		try:
-			typeName = type(item).__name__
-			infos.append(f'type = {typeName}')
-		except AttributeError:
-			pass
-		try:
+		# the tool tip is only built when it is actually requested, see _LayoutInfoToolTipFilter:
+		widgetStack = self._widgetStack
+		currentQLayout = self.currentLayout._qLayout
+		parentQLayout = widgetStack[-1]._qLayout if widgetStack else None
+		setattr(item, '_PythonGUI__layoutInfoToolTip', ft.partial(self._buildLayoutInfoToolTip, item, currentQLayout, parentQLayout))
+		_installLayoutInfoToolTipFilter()
+		return kwargs
+
+	def _buildLayoutInfoToolTip(self, item: QWidget, currentQLayout: Optional[QtWidgets.QLayout], parentQLayout: Optional[QtWidgets.QLayout]) -> str:
+		caps = _getLayoutInfoCapabilities(type(item))
+		infos: list[str] = [f'type = {type(item).__name__}']
+		if 'geometry' in caps and 'mapToParent' in caps:
 			gm = item.geometry()
 			tl = item.mapToParent(gm.topLeft())
 			gm = (tl.x(), tl.y(), gm.width(), gm.height())
 			infos.append(f'geometryP = {gm}')
-		except AttributeError:
-			pass
-		try:
+		if 'minimumSize' in caps:
 			ms = item.minimumSize()
 			ms = (ms.width(), ms.height())
 			infos.append(f'minSize = {ms if ms != (0, 0) else tuple()}')
-		except AttributeError:
-			pass
-		try:
+		if 'minimumSizeHint' in caps:
 			msh = item.minimumSizeHint()
 			msh = (msh.width(), msh.height())
 			infos.append(f'minSizeHint = {msh if msh != (0, 0) else tuple()}')
-		except AttributeError:
-			pass
-		try:
+		if 'sizeHint' in caps:
 			sh = item.sizeHint()
 			sh = (sh.width(), sh.height())
 			infos.append(f'sizeHint = {sh if sh != (0, 0) else tuple()}')
-		except AttributeError:
-			pass
-		try:
+		if 'sizePolicy' in caps:
 			sp = item.sizePolicy()
 			sp = (
-				SizePolicy(sp.horizontalPolicy()).name, sp.horizontalStretch(),
-				SizePolicy(sp.verticalPolicy()).name, sp.verticalStretch())
+				_SIZE_POLICY_NAMES[sp.horizontalPolicy()], sp.horizontalStretch(),
+				_SIZE_POLICY_NAMES[sp.verticalPolicy()], sp.verticalStretch())
 			infos.append(f'sizePolicy = {sp}')
-		except AttributeError:
-			pass
 		try:
 			cm = item.layout().contentsMargins()
 			cm = (cm.left(), cm.top(), cm.right(), cm.bottom())
 			infos.append(f'layoutContentsMargins = {cm}')
 		except AttributeError:
 			pass
-		try:
+		if 'contentsMargins' in caps:
 			cm = item.contentsMargins()
 			cm = (cm.left(), cm.top(), cm.right(), cm.bottom())
 			infos.append(f'contentsMargins = {cm}')
-		except AttributeError:
-			pass
-		try:
+		if 'viewportMargins' in caps:
 			cm = item.viewportMargins()
 			cm = (cm.left(), cm.top(), cm.right(), cm.bottom())
 			infos.append(f'viewportMargins = {cm}')
-		except AttributeError:
-			pass
 		try:
 			hs = item.layout().horizontalSpacing()
 			vs = item.layout().verticalSpacing()
@@ -1038,37 +1506,28 @@ class PythonGUI(CatScalableWidgetMixin):
 			infos.append(f'spacing = {spacing}')
 		except AttributeError:
 			pass
-		try:
+		if 'contentsRect' in caps:
 			cr = item.contentsRect()
 			cr = (cr.x(), cr.y(), cr.width(), cr.height())
 			infos.append(f'contentsRect = {cr}')
-		except AttributeError:
-			pass
-		try:
-			ol = getattr(item, 'overlap')()
+		if 'overlap' in caps:
+			ol = item.overlap()
 			infos.append(f'overlap = {ol}')
-		except AttributeError:
-			pass
-		try:
-			ol = getattr(item, 'overlapCharacteristics')
+		if 'overlapCharacteristics' in caps:
+			ol = item.overlapCharacteristics
 			infos.append(f'overlapCharacteristics (can, req, has) = \\')
 			infos.append(f'{ol}')
-		except AttributeError:
-			pass
-		try:
-			rc = getattr(item, 'roundedCorners')
-			if callable(rc):
-				rc = rc()
-			infos.append(f'roundedCorners = {rc}')
-		except AttributeError:
-			pass
-		except TypeError:
-			pass
-		try:
+		if 'roundedCorners' in caps:
+			rc = item.roundedCorners
+			try:
+				if callable(rc):
+					rc = rc()
+				infos.append(f'roundedCorners = {rc}')
+			except TypeError:
+				pass
+		if 'fontInfo' in caps:
 			ps = item.fontInfo().pointSize()
 			infos.append(f'fontInfo.pointSize = {ps}')
-		except AttributeError:
-			pass
 
 		try:
 			qLayout = item.layout()
@@ -1086,31 +1545,28 @@ class PythonGUI(CatScalableWidgetMixin):
 			pass
 
 		try:
-			qLayout = getattr(self.currentLayout, '_qLayout')
+			qLayout = currentQLayout
 			if isinstance(qLayout, QtWidgets.QGridLayout):
 				infos.append(f'======== ======== ======== ')
 				for c in range(qLayout.columnCount()):
 					ci = (qLayout.columnStretch(c), qLayout.columnMinimumWidth(c))
 					infos.append(f'    columns[{c}] = {ci}')
-		except AttributeError:
+		except (AttributeError, RuntimeError):  # RuntimeError: the layout might have been deleted in the meantime
 			pass
 
 		try:
-			if self._widgetStack:
-				qLayout = getattr(self._widgetStack.peek(), '_qLayout')
-				if isinstance(qLayout, QtWidgets.QGridLayout):
-					infos.append(f'======== ======== ======== ')
-					infos.append(f'-------- -------- -------- ')
-					for c in range(qLayout.columnCount()):
-						ci = (qLayout.columnStretch(c), qLayout.columnMinimumWidth(c))
-						infos.append(f'    columns[{c}] = {ci}')
-		except AttributeError:
+			qLayout = parentQLayout
+			if isinstance(qLayout, QtWidgets.QGridLayout):
+				infos.append(f'======== ======== ======== ')
+				infos.append(f'-------- -------- -------- ')
+				for c in range(qLayout.columnCount()):
+					ci = (qLayout.columnStretch(c), qLayout.columnMinimumWidth(c))
+					infos.append(f'    columns[{c}] = {ci}')
+		except (AttributeError, RuntimeError):
 			pass
 
 		toolTip: str = '\n'.join(infos)
-		kwargsCpy = kwargs.copy()
-		kwargsCpy['tip'] = toolTip
-		return kwargsCpy
+		return toolTip
 
 	def addFontInfoToToolTip(self, item: QWidget, kwargs: dict[str, Any]) -> dict[str, Any]:
 		infos: list[str] = []
@@ -1144,11 +1600,16 @@ class PythonGUI(CatScalableWidgetMixin):
 
 		hasShortcut: bool = False
 		for propName, value in kwargs.items():
+			kind = _PROP_KINDS.get(propName)
+			if kind is None:
+				kind = _classifyProp(propName)
 			# value is a style:
-			if propName == 'style':
-				if value is not None:
+			if kind is _PROP_KIND_STYLE:
+				# Styles are immutable, so an equal style doesn't have to be applied again:
+				if value is not None and value != getattr(item, '_PythonGUI__lastStyle', None):
 					applyStyle(item, value)
-			elif propName.startswith('on') and len(propName) > 2 and propName[2].isupper():
+					setattr(item, '_PythonGUI__lastStyle', value)
+			elif kind is _PROP_KIND_EVENT:
 				# value is an eventListener (a function), so connect it:
 				_connectEventListener(item, propName, value)
 			else:
@@ -1188,23 +1649,25 @@ class PythonGUI(CatScalableWidgetMixin):
 			onInit: Callable[[_TQWidget], None] = None,
 			**kwargs
 	) -> _TQWidget:
-		indentLevel = self.currentLayout.indentLevel
-		shouldIndent = indentLevel > 0 and self.currentLayout.canIndentItem(isPrefix)
-
-		if shouldIndent:
-			isSeamless = hasattr(self.currentLayout._qLayout, 'finalizeBorders')
+		currentLayout = self.currentLayout
+		indentLevel = currentLayout.indentLevel
+		if indentLevel <= 0 or not currentLayout.canIndentItem(isPrefix):  # the common case
+			item = currentLayout.addItem(ItemType, initArgs=initArgs, onInit=onInit, isPrefix=isPrefix)
+		else:
+			isSeamless = hasattr(currentLayout._qLayout, 'finalizeBorders')
 			rowLayoutCls = getSingleRowLayout(isSeamless)
-			qLayout = self.currentLayout.addItem(rowLayoutCls.QLayoutType, isPrefix=isPrefix)
+			qLayout = currentLayout.addItem(rowLayoutCls.QLayoutType, isPrefix=isPrefix)
 			qLayout.setHorizontalSpacing(0)
 			with rowLayoutCls(self, qLayout, preventVStretch=False, preventHStretch=False):
-				self.addHSpacer(int(17 * indentLevel * self._scale), SizePolicy.Fixed)
+				self.addHSpacer(int(self._indentWidth * indentLevel), SizePolicy.Fixed)
 				item = self.currentLayout.addItem(ItemType, initArgs=initArgs, onInit=onInit, isPrefix=isPrefix)
-		else:
-			item = self.currentLayout.addItem(ItemType, initArgs=initArgs, onInit=onInit, isPrefix=isPrefix)
 
 		# extract onCreate and onValueChanged functions:
-		onCreate = kwargs.pop('onCreate', None)
-		onValueChanged = kwargs.pop('onValueChanged', None)
+		if kwargs:
+			onCreate = kwargs.pop('onCreate', None)
+			onValueChanged = kwargs.pop('onValueChanged', None)
+		else:
+			onCreate = onValueChanged = None
 
 		# add kwArgs to Item
 		self.addkwArgsToItem(item, kwargs)
@@ -1213,17 +1676,16 @@ class PythonGUI(CatScalableWidgetMixin):
 		if isinstance(item, QWidget):
 			self._lastWidget = item
 			if Qt.TabFocus & item.focusPolicy():
-				if self._lastTabWidget is not None:
-					QWidget.setTabOrder(self._lastTabWidget, item)
-				else:
+				if self._lastTabWidget is None:
 					self._firstTabWidget = item
 				self._lastTabWidget = item
+				self._tabOrderWidgets.append(item)  # the tab order is set at the end of _redrawGUI()
 
 		# apply the onCreate function:
 		if onCreate:
 			onCreate(item)
 		# apply the onValueChanged function:
-		if onValueChanged and item == self.modifiedInput[0]:
+		if onValueChanged and item is self.modifiedInput[0]:
 			onValueChanged(item)
 
 		return item
@@ -1246,7 +1708,7 @@ class PythonGUI(CatScalableWidgetMixin):
 
 	def pushLayout(self, layoutInstance: LayoutBase):
 		assert self.currentLayout is not None
-		self._widgetStack.push(self.currentLayout)
+		self._widgetStack.append(self.currentLayout)  # list.append directly, skips the Python-level Stack.push(...)
 		self.currentLayout = layoutInstance
 
 	def popLayout(self, layoutInstance: LayoutBase):
@@ -1550,7 +2012,7 @@ class PythonGUI(CatScalableWidgetMixin):
 	def spoiler(self, label: str = '', isOpen: bool = None, **kwargs) -> bool:
 		spoiler = self.addItem(Spoiler, title=label, **kwargs)
 
-		if spoiler != self.modifiedInput[0] and spoiler.isOpen() != isOpen and isOpen is not None:
+		if spoiler is not self.modifiedInput[0] and spoiler.isOpen() != isOpen and isOpen is not None:
 			spoiler.setOpen(isOpen)
 
 		self._connectOnInputModified(spoiler, spoiler.clicked)
@@ -1614,8 +2076,8 @@ class PythonGUI(CatScalableWidgetMixin):
 					cornerGUI()
 			stackedWidget: SeamlessQStackedWidget = self.addItem(SeamlessQStackedWidget, **stackWidgetKwArgs)
 
-			redrawnCount = getattr(tabBar, '__redrawnCount', 0)
-			setattr(tabBar, '__redrawnCount', redrawnCount + 1)
+			redrawnCount = tabBar._redrawnCount
+			tabBar._redrawnCount = redrawnCount + 1
 
 			if redrawnCount == 0:
 				selectedTab = initialSelectedTab
@@ -1644,24 +2106,33 @@ class PythonGUI(CatScalableWidgetMixin):
 			from . import icons
 			closeIcon = icons.icons.closeTab
 		tabBar: CatTabBar = self.addItem(CatTabBar, minimumHeight=0, closeIcon=closeIcon, **kwargs)
-		redrawnCount = getattr(tabBar, '__redrawnCount', 0)
-		setattr(tabBar, '__redrawnCount', redrawnCount + 1)
+		redrawnCount = tabBar._redrawnCount
+		tabBar._redrawnCount = redrawnCount + 1
 
 		previouslySelected: int = tabBar.currentIndex()
 
-		for i, tab in enumerate(allTabs):
-			assert isinstance(tab, TabOptions)
-			if i < tabBar.count():
-				tabBar.setTabOptions(i, tab)
-			else:
-				tabBar.addTab(tab)
+		# skip syncing the tabs entirely, if nothing changed since the last redraw.
+		# _syncedTabOptions is always a list, so tuples etc. must be normalized for the comparison to work:
+		if type(allTabs) is not list:
+			allTabs = list(allTabs)
+		if tabBar._syncedTabOptions != allTabs:
+			tabCount = tabBar.count()
+			setTabOptions = tabBar.setTabOptions
+			addTab = tabBar.addTab
+			for i, tab in enumerate(allTabs):
+				assert isinstance(tab, TabOptions)
+				if i < tabCount:
+					setTabOptions(i, tab)
+				else:
+					addTab(tab)
 
-		while tabBar.count() > len(allTabs):
-			tabBar.removeTab(tabBar.count()-1)
+			if tabCount > len(allTabs):
+				tabBar.removeTabsFrom(len(allTabs))
+			tabBar._syncedTabOptions = list(allTabs)
 
 		if redrawnCount == 0 and initialSelectedTab is not None:
 			selectedTab = initialSelectedTab
-		if tabBar != self.modifiedInput[0] and selectedTab is not None:
+		if tabBar is not self.modifiedInput[0] and selectedTab is not None:
 			tabBar.setCurrentIndex(selectedTab)
 		else:
 			tabBar.setCurrentIndex(previouslySelected)
@@ -1703,10 +2174,8 @@ class PythonGUI(CatScalableWidgetMixin):
 		return self._splitter(orientation=Qt.Horizontal, handleWidth=handleWidth, **kwargs)
 
 	def subGUI(self, guiCls: Type[_TPythonGUI], guiFunc: Callable[[_TPythonGUI], None], label=None, *, seamless: bool = False, suppressRedrawLogging: bool = False, **kwargs) -> PythonGUI:
-		if 'onInit' in kwargs:
-			kwargs['onInit'] = lambda w, onInit=kwargs['onInit']: onInit(w) or w._gui.redrawGUI()
-		else:
-			kwargs['onInit'] = lambda w:  w._gui.redrawGUI()
+		onInit = kwargs.get('onInit')
+		kwargs['onInit'] = _RedrawSubGUIAfterOnInit(onInit) if onInit is not None else _redrawSubGUIOnInit
 
 		deferBorderFinalization = False  # hasattr(self.currentLayout._qLayout, 'finalizeBorders')
 		qwidget: PythonGUIWidget = self.addLabeledItem(PythonGUIWidget, label, initArgs=(guiFunc, guiCls, seamless, deferBorderFinalization), suppressRedrawLogging=suppressRedrawLogging, **kwargs)
@@ -1735,17 +2204,15 @@ class PythonGUI(CatScalableWidgetMixin):
 
 	def addHSpacer(self, size: int, sizePolicy: SizePolicy):
 		spacer = self.currentLayout.addItem(QtWidgets.QSpacerItem, initArgs=(0, 0))
-		needsInvalidation = False
-
-		needsInvalidation = needsInvalidation or spacer.sizeHint().width() != size
-		needsInvalidation = needsInvalidation or spacer.sizePolicy().horizontalPolicy() != sizePolicy
-		spacer.changeSize(size, 0, hPolicy=sizePolicy.value)
-		if needsInvalidation:
+		# only touch the spacer if it changed since the last redraw:
+		spacerKey = (size, sizePolicy, True)
+		if getattr(spacer, '_PythonGUI__spacerKey', None) != spacerKey:
+			spacer.changeSize(size, 0, hPolicy=sizePolicy.value)
 			spacer.invalidate()
+			setattr(spacer, '_PythonGUI__spacerKey', spacerKey)
 
 	def addVSpacer(self, size: int, sizePolicy: SizePolicy):
 		spacer = self.currentLayout.addItem(QtWidgets.QSpacerItem, initArgs=(0, 0))
-		needsInvalidation = False
 
 		qLayout = getattr(self.currentLayout, '_qLayout', None)
 		if hasattr(qLayout, 'setRowMinimumHeight') and hasattr(qLayout, 'getItemPosition'):
@@ -1754,11 +2221,12 @@ class PythonGUI(CatScalableWidgetMixin):
 				row, _, _, _ = qLayout.getItemPosition(index-1)
 				qLayout.setRowMinimumHeight(row, 0)
 
-		needsInvalidation = needsInvalidation or spacer.sizeHint().height() != size
-		needsInvalidation = needsInvalidation or spacer.sizePolicy().verticalPolicy() != sizePolicy
-		spacer.changeSize(0, size, vPolicy=sizePolicy.value)
-		if needsInvalidation:
+		# only touch the spacer if it changed since the last redraw:
+		spacerKey = (size, sizePolicy, False)
+		if getattr(spacer, '_PythonGUI__spacerKey', None) != spacerKey:
+			spacer.changeSize(0, size, vPolicy=sizePolicy.value)
 			spacer.invalidate()
+			setattr(spacer, '_PythonGUI__spacerKey', spacerKey)
 
 	def addToolbarSpacer(self, sizePolicy: SizePolicy, overlap: Overlap = (0, 0), roundedCorners: RoundedCorners = CORNERS.NONE):
 		spacer: CatToolbarSpacer = self.addItem(CatToolbarSpacer, overlap=overlap, roundedCorners=roundedCorners)
@@ -1787,7 +2255,7 @@ class PythonGUI(CatScalableWidgetMixin):
 
 	def popupWindow(
 			self, initVal: _TT,
-			guiFunc: Callable[[_TPythonGUI, _TT], _TT] = lambda gui, v, **kwargs: gui.valueField(v, **kwargs),
+			guiFunc: Callable[[_TPythonGUI, _TT], _TT] = _defaultValueFieldGuiFunc,
 			*,
 			width: Optional[int] = None,
 			height: Optional[int] = None,
@@ -1817,10 +2285,17 @@ class PythonGUI(CatScalableWidgetMixin):
 			result = PythonGUIPopupWindow.getValue(type(self), initVal, guiFunc, parent=lastItem, **geometry)
 		return result
 
-	@staticmethod
-	def getFieldWidth(widget, letterCount=6):
-		fm = widget.fontMetrics()
-		return fm.size(Qt.TextSingleLine, 'M'*letterCount).width()
+	# field widths by (font.key(), logicalDpiY, letterCount). The key of a font describes it completely, so no invalidation is needed:
+	_fieldWidthCache: ClassVar[dict[tuple[str, int, int], int]] = {}
+
+	@classmethod
+	def getFieldWidth(cls, widget, letterCount=6):
+		cacheKey = (widget.font().key(), widget.logicalDpiY(), letterCount)
+		width = cls._fieldWidthCache.get(cacheKey)
+		if width is None:
+			fm = widget.fontMetrics()
+			width = cls._fieldWidthCache[cacheKey] = fm.size(Qt.TextSingleLine, 'M'*letterCount).width()
+		return width
 
 	@classmethod
 	def setMinimumFieldWidth(cls, widget: QWidget, letterCount=6):
@@ -1849,13 +2324,23 @@ class PythonGUI(CatScalableWidgetMixin):
 		float: 'num'
 	}
 
+	# resolved argKeys of switchLabelContent(...) by (cls, type(value)):
+	_labelContentKwArgCache: ClassVar[dict[tuple[type, type], str]] = {}
+
 	@classmethod
 	def switchLabelContent(cls, value, kwArgsIO: dict) -> None:
+		if type(value) is str:  # by far the most common case
+			kwArgsIO['text'] = value
+			return
 		if value is True:
 			value = 'true'
 		elif value is False:
 			value = 'false'
-		cls.switchKwArg(value, cls._labelContentKwArgSwitchMap, 'text',  kwArgsIO=kwArgsIO)
+		cacheKey = (cls, type(value))
+		argKey = cls._labelContentKwArgCache.get(cacheKey)
+		if argKey is None:
+			argKey = cls._labelContentKwArgCache[cacheKey] = getIfKeyIssubclass(cls._labelContentKwArgSwitchMap, type(value), 'text')
+		kwArgsIO[argKey] = value
 
 	def _button(self, ButtonCls: Type[CatButton], text='', icon: QtGui.QIcon = None, autoDefault: bool = False, overlap: Overlap = (0, 0), roundedCorners: RoundedCorners = CORNERS.ALL, **kwargs) -> bool:
 		if icon is None:
@@ -1869,12 +2354,12 @@ class PythonGUI(CatScalableWidgetMixin):
 		button: CatButton = self.addItem(ButtonCls, text=text, icon=icon, autoDefault=autoDefault, overlap=overlap, roundedCorners=roundedCorners, **kwargs)
 		self._connectOnInputModified(button, button.clicked)
 
-		if button is not self.modifiedInput[0] and button.isCheckable() and checked is not None:
-			button.setChecked(checked)
-		elif button is self.modifiedInput[0]:
+		if button is self.modifiedInput[0]:
 			self._forceSecondRedraw = True
 			if not button.isCheckable():
 				return True
+		elif checked is not None and button.isCheckable():
+			button.setChecked(checked)
 		return button.isChecked()
 
 	def button(self, text='', icon: QtGui.QIcon = None, autoDefault: bool = False, overlap: Overlap = (0, 0), roundedCorners: RoundedCorners = CORNERS.ALL, **kwargs):
@@ -1911,49 +2396,66 @@ class PythonGUI(CatScalableWidgetMixin):
 	}
 
 	def getDefaultButtonText(self, btnId: MessageBoxButton) -> str:
-		return self._defaultButtonTranslations.get(btnId, lambda: '')()
+		# translating is comparatively expensive, so the texts are cached until the language changes:
+		text = self._buttonTextCache.get(btnId)
+		if text is None:
+			translate = self._defaultButtonTranslations.get(btnId)
+			text = self._buttonTextCache[btnId] = translate() if translate is not None else ''
+		return text
+
+	_leftDialogButtonsOrder: ClassVar[tuple[MessageBoxButton, ...]] = (
+		MessageBoxButton.Reset,
+		MessageBoxButton.RestoreDefaults,
+	)
+	_rightDialogButtonsOrder: ClassVar[tuple[MessageBoxButton, ...]] = (
+		MessageBoxButton.Help,
+		MessageBoxButton.Yes,
+		MessageBoxButton.YesToAll,
+		MessageBoxButton.Ok,
+		MessageBoxButton.Save,
+		MessageBoxButton.SaveAll,
+		MessageBoxButton.Open,
+		MessageBoxButton.Retry,
+		MessageBoxButton.Ignore,
+		MessageBoxButton.Discard,
+		MessageBoxButton.No,
+		MessageBoxButton.NoToAll,
+		MessageBoxButton.Abort,
+		MessageBoxButton.Close,
+		MessageBoxButton.Cancel,
+		MessageBoxButton.Apply,
+	)
+	# position of every button in the button bar. The spacer sits between the left and the right buttons. Lets
+	# dialogButtons(...) only look at the buttons actually given, instead of hashing every possible button
+	# (Enum.__hash__ is implemented in python):
+	_dialogButtonsSpacerRank: ClassVar[int] = len(_leftDialogButtonsOrder)
+	_dialogButtonsRank: ClassVar[dict[MessageBoxButton, int]] = {
+		btnId: i for i, btnId in enumerate((*_leftDialogButtonsOrder, None, *_rightDialogButtonsOrder)) if btnId is not None
+	}
 
 	def dialogButtons(self, buttons: dict[MessageBoxButton, Callable[[MessageBoxButton], None] | tuple[Callable[[MessageBoxButton], None], dict[str, Any]]], defaultBtn: MessageBoxButton = MessageBoxButton.Ok, **kwargs):
-		leftButtonsOrder = [
-			MessageBoxButton.Reset,
-			MessageBoxButton.RestoreDefaults,
-		]
-		rightButtonsOrder = [
-			MessageBoxButton.Help,
-			MessageBoxButton.Yes,
-			MessageBoxButton.YesToAll,
-			MessageBoxButton.Ok,
-			MessageBoxButton.Save,
-			MessageBoxButton.SaveAll,
-			MessageBoxButton.Open,
-			MessageBoxButton.Retry,
-			MessageBoxButton.Ignore,
-			MessageBoxButton.Discard,
-			MessageBoxButton.No,
-			MessageBoxButton.NoToAll,
-			MessageBoxButton.Abort,
-			MessageBoxButton.Close,
-			MessageBoxButton.Cancel,
-			MessageBoxButton.Apply,
-		]
-
 		def addButton(btnId: MessageBoxButton, action: Callable[[MessageBoxButton], None] | tuple[Callable[[MessageBoxButton], None], dict[str, Any]], default: bool):
 			btnText = self.getDefaultButtonText(btnId)
-			minimumWidth = int(80 * self._scale)
-			action, kwArgs = action if isinstance(action, tuple) else (action, {})
+			action, kwArgs = action if type(action) is tuple else (action, _EMPTY_KWARGS)
 			if self.button(btnText, autoDefault=False, default=default, minimumWidth=minimumWidth, **kwArgs) and action is not None:
 				action(btnId)
 
-		with self.hLayout(fullSize=True, **kwargs):
-			for btnId in leftButtonsOrder:
-				if btnId in buttons:
-					addButton(btnId, buttons[btnId], btnId == defaultBtn)
-
-			self.addHSpacer(int(16 * self._scale), SizePolicy.MinimumExpanding)
+		minimumWidth = int(80 * self._scale)
+		spacerWidth = int(16 * self._scale)
+		rank = self._dialogButtonsRank
+		# all buttons and the spacer (btnId = None) in the order they appear in. ranks are unique, so sorted(...) never
+		# has to compare btnIds or actions:
+		plan = sorted([
+			(self._dialogButtonsSpacerRank, None, None),
+			*((rank[btnId], btnId, action) for btnId, action in buttons.items() if btnId in rank)
+		])
 
-			for btnId in rightButtonsOrder:
-				if btnId in buttons:
-					addButton(btnId, buttons[btnId], btnId == defaultBtn)
+		with self.hLayout(fullSize=True, **kwargs):
+			for _, btnId, action in plan:
+				if btnId is None:
+					self.addHSpacer(spacerWidth, SizePolicy.MinimumExpanding)
+				else:
+					addButton(btnId, action, btnId is defaultBtn)
 
 	def _label(self, LabelCls: Type[QtWidgets.QLabel], content: LabelContent, style: Style, selectable: bool, **kwargs) -> None:
 		if style is None:
@@ -1963,16 +2465,25 @@ class PythonGUI(CatScalableWidgetMixin):
 		self.switchLabelContent(content, kwArgsIO=kwargs)
 		label: QtWidgets.QLabel = self.addItem(LabelCls, style=style, **kwargs)
 
-		sp = label.sizePolicy()
-		if 'hSizePolicy' not in kwargs:
-			if not isinstance(getattr(self.currentLayout, '_qLayout', None), QtWidgets.QGridLayout):
-				sp.setHorizontalPolicy(SizePolicy.Minimum.value)
-			else:
-				sp.setHorizontalPolicy(SizePolicy.Preferred.value)
-				sp.setHorizontalStretch(0)
-		if 'vSizePolicy' not in kwargs:
-			sp.setVerticalPolicy(SizePolicy.Fixed.value)
-		label.setSizePolicy(sp)
+		if 'hSizePolicy' in kwargs:
+			hPolicy = None
+		elif not isinstance(self.currentLayout._qLayout, QGridLayout):
+			hPolicy = SizePolicy.Minimum.value
+		else:
+			hPolicy = SizePolicy.Preferred.value
+		vPolicy = None if 'vSizePolicy' in kwargs else SizePolicy.Fixed.value
+		# only touch the sizePolicy if it changed since the last redraw. This avoids needlessly invalidating the layout:
+		desiredPolicies = (hPolicy, vPolicy)
+		if getattr(label, '_PythonGUI__labelSizePolicies', None) != desiredPolicies:
+			sp = label.sizePolicy()
+			if hPolicy is not None:
+				sp.setHorizontalPolicy(hPolicy)
+				if hPolicy == SizePolicy.Preferred.value:
+					sp.setHorizontalStretch(0)
+			if vPolicy is not None:
+				sp.setVerticalPolicy(vPolicy)
+			label.setSizePolicy(sp)
+			setattr(label, '_PythonGUI__labelSizePolicies', desiredPolicies)
 
 	def label(self, text: LabelContent, style: Style = None, selectable: bool = False, **kwargs) -> None:
 		self._label(CatLabel, text, style, selectable, **kwargs)
@@ -2000,7 +2511,7 @@ class PythonGUI(CatScalableWidgetMixin):
 		label: CatLabel = self.addItem(CatLabel, style=style, **kwargs)
 
 		sp = label.sizePolicy()
-		if not isinstance(getattr(self.currentLayout, '_qLayout', None), QtWidgets.QGridLayout):
+		if not isinstance(getattr(self.currentLayout, '_qLayout', None), QGridLayout):
 			sp.setHorizontalPolicy(SizePolicy.Minimum.value)
 
 		sp.setVerticalPolicy(SizePolicy.Fixed.value)
@@ -2018,11 +2529,12 @@ class PythonGUI(CatScalableWidgetMixin):
 		'warning': getStyles().warning,
 		'error': getStyles().error
 	}
+	# wrapped once, so helpBox(...) doesn't have to build a new Style on every redraw:
+	_helpBoxWrappedStyles: ClassVar[dict[str, Style]] = {k: Style({'QLabel': v}) for k, v in helpBoxStyles.items()}
 
 	def helpBox(self, text: str, style: str = 'hint', elided: bool = False, wordWrap: bool = True, hasLabel: bool = True, **kwargs):
 		""" displays a full width Help Box"""
-		assert style in self.helpBoxStyles
-		style = Style({'QLabel': self.helpBoxStyles[style]})
+		style = self._helpBoxWrappedStyles[style]
 
 		kwargs.setdefault('textInteractionFlags', Qt.TextSelectableByMouse | Qt.LinksAccessibleByMouse)
 		if text:
@@ -2048,15 +2560,28 @@ class PythonGUI(CatScalableWidgetMixin):
 		
 		prevCursorPosition = textField.cursorPosition()
 		if isMultiline:
-			textField.setTabStopWidth(textField.fontMetrics().averageCharWidth() * 4)
-
-		if textField != self.modifiedInput[0] and textField.plainText() != text and text is not None:
-			textField.setPlainText(text)
-			if focusEndOfText:
-				newCursorPosition = textField.plainText().rfind('\n')+1 if isMultiline else len(textField.plainText())
-			else:
-				newCursorPosition = min(len(text), prevCursorPosition)
-			textField.setCursorPosition(newCursorPosition)
+			tabStopWidth = textField.fontMetrics().averageCharWidth() * 4
+			if getattr(textField, '_PythonGUI__tabStopWidth', None) != tabStopWidth:
+				textField.setTabStopWidth(tabStopWidth)
+				setattr(textField, '_PythonGUI__tabStopWidth', tabStopWidth)
+
+		# _PythonGUI__lastText is the text last synced from python. It is reset whenever the text of the widget changes,
+		# so if it is equal to text, the widget is known to be up-to-date, and plainText() doesn't have to be called:
+		if not isConnectedOnce(textField, textField.textChanged, '_clearLastText_'):
+			connectOnlyOnce(textField, textField.textChanged, lambda _=None: setattr(textField, '_PythonGUI__lastText', None), '_clearLastText_')
+		if text is not None and textField is not self.modifiedInput[0]:
+			if getattr(textField, '_PythonGUI__lastText', None) == text:
+				self._connectOnInputModified(textField, textField.textChanged)
+				return text
+			if textField.plainText() != text:
+				textField.setPlainText(text)
+				if focusEndOfText:
+					newCursorPosition = textField.plainText().rfind('\n')+1 if isMultiline else len(textField.plainText())
+				else:
+					newCursorPosition = min(len(text), prevCursorPosition)
+				if newCursorPosition != textField.cursorPosition():
+					textField.setCursorPosition(newCursorPosition)
+			setattr(textField, '_PythonGUI__lastText', text)
 
 		self._connectOnInputModified(textField, textField.textChanged)
 		return textField.plainText()
@@ -2132,7 +2657,7 @@ class PythonGUI(CatScalableWidgetMixin):
 			self: _TS,
 			title: str,
 			initVal: _TT,
-			guiFunc: Callable[[_TS, _TT], _TT] = lambda gui, v: gui.valueField(v),
+			guiFunc: Callable[[_TS, _TT], _TT] = _defaultValueFieldGuiFunc,
 			*,
 			windowModality: Qt.WindowModality = Qt.WindowModal,
 			width: Optional[int] = None, height: Optional[int] = None,
@@ -2148,7 +2673,7 @@ class PythonGUI(CatScalableWidgetMixin):
 			self: _TS,
 			title: str,
 			initVal: _TT,
-			guiFunc: Callable[[_TS, _TT], _TT] = lambda gui, v: gui.valueField(v),
+			guiFunc: Callable[[_TS, _TT], _TT] = _defaultValueFieldGuiFunc,
 			*,
 			width: Optional[int] = None, height: Optional[int] = None,
 			**kwargs
@@ -2161,14 +2686,10 @@ class PythonGUI(CatScalableWidgetMixin):
 	def showFileDialog(self, path, filters: Sequence[FileExtensionFilter] = (), selectedFilter: FileExtensionFilter = None, *, style: Literal['open', 'save'] = 'open', returnOldPathOnCancel: bool = False) -> Optional[str]:
 		assert style in self.fileDialogStyles
 
-		def toFilterStr(fileFilter: FileExtensionFilter):
-			extensionList = fileFilter[1] if isinstance(fileFilter[1], str) else " *".join(fileFilter[1])
-			return f"{fileFilter[0]}, (*{extensionList})"
-
 		if style in {'save'}:
 			for fileFilter in filters:
 				assert len(fileFilter[1]) == 1 or isinstance(fileFilter[1], str), \
-					f"The save file dialog doesn't support grouping of file extensions: '{toFilterStr(fileFilter)}'"
+					f"The save file dialog doesn't support grouping of file extensions: '{_toFilterStr(fileFilter)}'"
 
 		if style == 'open':
 			fileDialog = QtWidgets.QFileDialog.getOpenFileName
@@ -2177,16 +2698,15 @@ class PythonGUI(CatScalableWidgetMixin):
 			fileDialog = QtWidgets.QFileDialog.getSaveFileName
 			title = 'Save File'
 
-		filterStrs = list(map(toFilterStr, filters))
+		filterStrs = list(map(_toFilterStr, filters))
 		filtersStr = ";;".join(filterStrs)
-		selectedFilterStr = toFilterStr(selectedFilter) if selectedFilter is not None else None
+		selectedFilterStr = _toFilterStr(selectedFilter) if selectedFilter is not None else None
 
 		with self.overlay():
 			newPath, extDescr = fileDialog(self.host, title, path, filtersStr, selectedFilterStr)
 		if newPath:
 			# TODO: add extension to filePath on Linux!
-			import platform
-			if style in {'save'} and platform.system().lower() == "linux":
+			if style in {'save'} and _IS_LINUX:
 				# on Linux, QFileDialog.getSaveFileName doesn't add the file extension, so lets do that here:
 				reqExt = filters[filterStrs.index(extDescr)][1]
 				reqExt = reqExt[0] if not isinstance(reqExt, str) else reqExt
@@ -2258,7 +2778,7 @@ class PythonGUI(CatScalableWidgetMixin):
 	def qintField(self, value: Optional[int], min: int = 0, max: int = +99, step: int = 1, label: Optional[str] = None, **kwargs):
 		intField = self.addLabeledItem(QtWidgets.QSpinBox, label, minimum=min, maximum=max, singleStep=step, onInit=self.setMinimumFieldWidth, **kwargs)
 
-		if value is not None and intField != self.modifiedInput[0] and intField.value() != value:
+		if value is not None and intField is not self.modifiedInput[0] and intField.value() != value:
 			intField.setValue(value)
 
 		self._connectOnInputModified(intField, intField.valueChanged)
@@ -2267,7 +2787,7 @@ class PythonGUI(CatScalableWidgetMixin):
 	def intField(self, value: Optional[int], min: int = 0, max: int = +99, step: int = 1, label: Optional[str] = None, **kwargs):
 		intField = self.addLabeledItem(Int64SpinBox, label, minimum=min, maximum=max, singleStep=step, onInit=self.setMinimumFieldWidth, **kwargs)
 
-		if value is not None and intField != self.modifiedInput[0] and intField.value() != value:
+		if value is not None and intField is not self.modifiedInput[0] and intField.value() != value:
 			intField.setValue(value)
 
 		self._connectOnInputModified(intField, intField.valueChanged)
@@ -2275,7 +2795,7 @@ class PythonGUI(CatScalableWidgetMixin):
 
 	def floatField(self, value: Optional[float], min: float = -math.inf, max: float = +math.inf, step: float = 0.01, decimals: int = 3, label: Optional[str] = None, **kwargs):
 		floatField = self.addLabeledItem(QtWidgets.QDoubleSpinBox, label, minimum=min, maximum=max, singleStep=step, decimals=decimals, onInit=self.setMinimumFieldWidth, **kwargs)
-		if value is not None and floatField != self.modifiedInput[0] and floatField.value() != value:
+		if value is not None and floatField is not self.modifiedInput[0] and floatField.value() != value:
 			floatField.setValue(value)
 		self._connectOnInputModified(floatField, floatField.valueChanged)
 		return floatField.value()
@@ -2290,24 +2810,42 @@ class PythonGUI(CatScalableWidgetMixin):
 		kwargs.setdefault('hSizePolicy', QSizePolicy.Expanding)
 		comboBox: CatComboBox = self.addLabeledItem(CatComboBox, label, editable=editable, **kwargs)
 
-		allCurrentItems = [comboBox.itemText(i) for i in range(comboBox.count())]
 		choices = list(choices)
-		if allCurrentItems != choices:
-			comboBox.clear()
-			comboBox.addItems(choices)
-		if (completer := comboBox.completer()) is not None:
+		# syncedChoices is reset whenever the items of the combo box change, so if it is equal to choices, the items don't
+		# have to be read back from Qt:
+		if comboBox.syncedChoices() != choices:
+			allCurrentItems = [comboBox.itemText(i) for i in range(comboBox.count())]
+			if allCurrentItems != choices:
+				comboBox.setChoices(choices)
+			comboBox.setSyncedChoices(choices)
+		if (completer := comboBox.completer()) is not None and getattr(comboBox, '_PythonGUI__popupCompleter', None) is not completer:
 			completer.setCompletionMode(QtWidgets.QCompleter.PopupCompletion)
+			setattr(comboBox, '_PythonGUI__popupCompleter', completer)
 
-		valueIsStr = isinstance(value, str)
-		setCurrentValue: Callable[[Union[str, int]], None] = comboBox.setCurrentText if valueIsStr else comboBox.setCurrentIndex
-		getCurrentValue = comboBox.currentText if valueIsStr else comboBox.currentIndex
+		self._connectOnInputModified(comboBox, comboBox.currentTextChanged[str])
+		# _PythonGUI__lastValue is reset whenever the current item or text changes, so if it is equal to value,
+		# the combo box is known to be up-to-date, and nothing has to be read back from Qt:
+		if not isConnectedOnce(comboBox, comboBox.currentTextChanged[str], '_clearLastValue_'):
+			clearLastValue = lambda _=None: setattr(comboBox, '_PythonGUI__lastValue', None)
+			connectOnlyOnce(comboBox, comboBox.currentTextChanged[str], clearLastValue, '_clearLastValue_')
+			connectOnlyOnce(comboBox, comboBox.currentIndexChanged[int], clearLastValue, '_clearLastValue_')
 
-		if comboBox != self.modifiedInput[0] and getCurrentValue() != value:
-			setCurrentValue(value)
+		isModified = comboBox is self.modifiedInput[0]
+		if not isModified and value is not None and getattr(comboBox, '_PythonGUI__lastValue', None) == value:
+			return value
 
-		self._connectOnInputModified(comboBox, comboBox.currentTextChanged[str])
+		valueIsStr = isinstance(value, str)
+		getCurrentValue = comboBox.currentText if valueIsStr else comboBox.currentIndex
+		if not isModified and getCurrentValue() != value:
+			if valueIsStr:
+				comboBox.setCurrentText(value)
+			else:
+				comboBox.setCurrentIndex(value)
 
-		return getCurrentValue()
+		currentValue = getCurrentValue()
+		if currentValue == value:
+			setattr(comboBox, '_PythonGUI__lastValue', value)
+		return currentValue
 
 	def autoCompletionTreeComboBox(self, value: str, autoCompletionTree: codeEditor.AutoCompletionTree, label=None, prefix: str = None, **kwargs) -> str:
 		rest = value
@@ -2327,11 +2865,7 @@ class PythonGUI(CatScalableWidgetMixin):
 					if sep:
 						lastTree = currentTree
 					break
-		if prefix:
-			choices = [prefix + member.qName + member.separator[:-1] for member in lastTree.members()]
-		else:
-			choices = [member.qName + member.separator[:-1] for member in lastTree.members()]
-
+		choices = lastTree.memberChoices(prefix or '')
 		return self.comboBox(value, choices, label, editable=True, **kwargs)
 
 	def fontComboBox(self, value: QFont, label: str = None, *, editable: bool = True, **kwargs) -> QFont:
@@ -2343,14 +2877,14 @@ class PythonGUI(CatScalableWidgetMixin):
 			kwargs['onInit'] = lambda x, onInit=kwargs['onInit']: self.setMinimumFieldWidth(x) or onInit(x)
 		comboBox: QtWidgets.QFontComboBox = self.addLabeledItem(QtWidgets.QFontComboBox, label, editable=editable, **kwargs)
 
-		valueIsStr = isinstance(value, str)
-
-		if comboBox != self.modifiedInput[0] and comboBox.currentFont().family() != value.family():
+		currentFont = comboBox.currentFont()
+		if comboBox is not self.modifiedInput[0] and currentFont.family() != value.family():
 			comboBox.setCurrentFont(value)
+			currentFont = comboBox.currentFont()
 
 		self._connectOnInputModified(comboBox, comboBox.currentFontChanged)
 
-		return comboBox.currentFont()
+		return currentFont
 
 	def fontFamilyComboBox(self, value: str, label: str = None, *, editable: bool = False, writingSystem: QFontDatabase.WritingSystem = None, predicate: Callable[[QFontDatabase, str], bool] = None, **kwargs) -> str:
 		"""
@@ -2359,16 +2893,26 @@ class PythonGUI(CatScalableWidgetMixin):
 			- writingSystem: the writingSystem the font must support
 			- predicate: a function for further filtering the font families or None.
 		"""
-		fontDB = QFontDatabase()
-		choices = fontDB.families(QFontDatabase.Any if writingSystem is None else writingSystem)
+		choices = _getFontFamilies(QFontDatabase.Any if writingSystem is None else writingSystem)
 		if predicate is not None:
-			choices = filter(ft.partial(predicate, fontDB), choices)
+			# filtered outside the cache, because predicates are usually new lambdas on every redraw:
+			fontDB = _getFontDatabase()
+			choices = [family for family in choices if predicate(fontDB, family)]
 		return self.comboBox(value, choices, label, editable=editable, **kwargs)
 
 	def dateField(self, value: Optional[date], label: Optional[str] = None, **kwargs) -> date:
 		dateField = self.addLabeledItem(QtWidgets.QDateEdit, label, onInit=self.setMinimumFieldWidth, **kwargs)
-		if value is not None and dateField != self.modifiedInput[0] and dateField.date().toPyDate() != value:
-			dateField.setDate(_toQDate(value))
+		# _PythonGUI__lastDate is the date last synced from python. It is reset whenever the date of the widget changes,
+		# so if it is equal to value, the widget is known to be up-to-date, and date() doesn't have to be called:
+		if not isConnectedOnce(dateField, dateField.dateChanged, '_clearLastDate_'):
+			connectOnlyOnce(dateField, dateField.dateChanged, lambda _=None: setattr(dateField, '_PythonGUI__lastDate', None), '_clearLastDate_')
+		if value is not None and dateField is not self.modifiedInput[0]:
+			if getattr(dateField, '_PythonGUI__lastDate', None) == value:
+				self._connectOnInputModified(dateField, dateField.dateChanged)
+				return value
+			if dateField.date().toPyDate() != value:
+				dateField.setDate(_toQDate(value))
+			setattr(dateField, '_PythonGUI__lastDate', value)
 
 		self._connectOnInputModified(dateField, dateField.dateChanged)
 		return dateField.date().toPyDate()
@@ -2376,7 +2920,7 @@ class PythonGUI(CatScalableWidgetMixin):
 	def slider(self, value: int, min: int, max: int, label: Optional[str] = None, orientation=QtCore.Qt.Horizontal, **kwargs):
 		slider = self.addLabeledItem(QtWidgets.QSlider, label, minimum=min, maximum=max, orientation=orientation, **kwargs)
 
-		if value is not None and slider != self.modifiedInput[0] and slider.value() != value:
+		if value is not None and slider is not self.modifiedInput[0] and slider.value() != value:
 			slider.setValue(value)
 
 		self._connectOnInputModified(slider, slider.valueChanged)
@@ -2385,7 +2929,7 @@ class PythonGUI(CatScalableWidgetMixin):
 	def scrollBar(self, value: Optional[int], docSize: int, pageStep: int, orientation=QtCore.Qt.Horizontal, **kwargs):
 		slider: QtWidgets.QScrollBar = self.addItem(QtWidgets.QScrollBar, minimum=0, maximum=docSize + 0 - pageStep, pageStep=pageStep, orientation=orientation, **kwargs)
 
-		if value is not None and slider != self.modifiedInput[0] and slider.value() != value:
+		if value is not None and slider is not self.modifiedInput[0] and slider.value() != value:
 			slider.setValue(value)
 
 		self._connectOnInputModified(slider, slider.valueChanged)
@@ -2396,14 +2940,17 @@ class PythonGUI(CatScalableWidgetMixin):
 		checkbox = self.addLabeledItem(CatCheckBox, label, **kwargs)
 		checkbox.setTristate(tristate)
 
+		# setSizePolicy(...) and setContentsMargins(...) always invalidate the layout, so only call them if necessary:
 		sp = checkbox.sizePolicy()
-		sp.setHorizontalPolicy(SizePolicy.Fixed.value)
-		checkbox.setSizePolicy(sp)
+		if sp.horizontalPolicy() != SizePolicy.Fixed.value:
+			sp.setHorizontalPolicy(SizePolicy.Fixed.value)
+			checkbox.setSizePolicy(sp)
 
 		l, t, r, b = checkbox.getContentsMargins()
-		checkbox.setContentsMargins(15, t, 15, b)
+		if l != 15 or r != 15:
+			checkbox.setContentsMargins(15, t, 15, b)
 
-		if isChecked is not None and checkbox != self.modifiedInput[0]:
+		if isChecked is not None and checkbox is not self.modifiedInput[0]:
 			if type(isChecked) is bool:
 				if checkbox.isChecked() != isChecked:
 					checkbox.setChecked(isChecked)
@@ -2420,12 +2967,13 @@ class PythonGUI(CatScalableWidgetMixin):
 		checkbox = self.addItem(CatCheckBox, text=label, **kwargs)
 		checkbox.setTristate(tristate)
 
-		if not isinstance(getattr(self.currentLayout, '_qLayout', None), QtWidgets.QGridLayout):
+		if not isinstance(getattr(self.currentLayout, '_qLayout', None), QGridLayout):
 			sp = checkbox.sizePolicy()
-			sp.setHorizontalPolicy(SizePolicy.Fixed.value)
-			checkbox.setSizePolicy(sp)
+			if sp.horizontalPolicy() != SizePolicy.Fixed.value:
+				sp.setHorizontalPolicy(SizePolicy.Fixed.value)
+				checkbox.setSizePolicy(sp)
 
-		if isChecked is not None and checkbox != self.modifiedInput[0]:
+		if isChecked is not None and checkbox is not self.modifiedInput[0]:
 			if type(isChecked) is bool:
 				if checkbox.isChecked() != isChecked:
 					checkbox.setChecked(isChecked)
@@ -2455,7 +3003,7 @@ class PythonGUI(CatScalableWidgetMixin):
 
 		toggle: Switch = self.addLabeledItem(Switch, label, **kwargs)
 
-		if isChecked is not None and toggle != self.modifiedInput[0] and toggle.isChecked() != isChecked:
+		if isChecked is not None and toggle is not self.modifiedInput[0] and toggle.isChecked() != isChecked:
 			toggle.setChecked(isChecked)
 
 		self._connectOnInputModified(toggle, toggle.toggled)
@@ -2479,7 +3027,7 @@ class PythonGUI(CatScalableWidgetMixin):
 				btnGroup.setId(radioButton, id)
 
 		radioButton.setAutoExclusive(group is None)
-		if isChecked is not None and radioButton != self.modifiedInput[0] and radioButton.isChecked() != isChecked:
+		if isChecked is not None and radioButton is not self.modifiedInput[0] and radioButton.isChecked() != isChecked:
 			radioButton.setChecked(isChecked)
 
 		self._connectOnInputModified(radioButton, radioButton.toggled)
@@ -2495,20 +3043,19 @@ class PythonGUI(CatScalableWidgetMixin):
 				setattr(layout._qLayout, '_buttonGroup', buttonGroup)
 
 			currentValue = buttonGroup.checkedId()
-			for i in range(0, len(radioButtons)):
+			for i, text in enumerate(radioButtons):
 				btn: CatRadioButton = self.addItem(CatRadioButton, **kwargs)
-				btn.setText(radioButtons[i])
-				if btn.group() != buttonGroup:
+				btn.setText(text)
+				if btn.group() is not buttonGroup:
 					buttonGroup.addButton(btn, i)
-				else:
+				elif buttonGroup.id(btn) != i:
 					buttonGroup.setId(btn, i)
 
 		buttonGroup.setExclusive(True)
-		if btnGrpLayout != self.modifiedInput[0] and buttonGroup.checkedId() != value:
-			if value is not None:
-				buttonGroup.buttons()[value].setChecked(True)
-			elif buttonGroup.button(currentValue) is not None:
-				buttonGroup.button(currentValue).setChecked(True)
+		if btnGrpLayout is not self.modifiedInput[0] and buttonGroup.checkedId() != value:
+			btn = buttonGroup.button(value if value is not None else currentValue)
+			if btn is not None:
+				btn.setChecked(True)
 
 		# event gets fired twice (1x for button that turned on and 1x for button that turned off).
 		# make sure only one event triggers a redrawing:
@@ -2522,19 +3069,22 @@ class PythonGUI(CatScalableWidgetMixin):
 			connectSafe(listBox.model().modelReset, lambda: self.OnInputModified(listBox.model()))
 
 		selection = listBox.selectionModel()
-		if listBox != self.modifiedInput[0]:  # and listBox.currentIndex().row() != index:
+		if listBox is not self.modifiedInput[0]:  # and listBox.currentIndex().row() != index:
 			if valuesHaveChanged:
 				if index is None:
 					index = listBox.currentIndex().row()
-				listBox.model().setStringList(values)
+				# setStringList(...) always resets the model (and therefore the view), so only call it if something changed:
+				if listBox.model().stringList() != values:
+					listBox.model().setStringList(values)
 			if index is not None:
 				indexOfTheCellIWant = listBox.model().index(index, 0)
 				selection.setCurrentIndex(indexOfTheCellIWant, QtCore.QItemSelectionModel.ClearAndSelect)
 
-		# connectOnlyOnce does not work here, because sometimes the __dict__ attribute doesn't get persisted properly:
-		if QtCore.QObject.receivers(selection, selection.selectionChanged) == 1:  # '1' required here, because the QListView also connects to that signal
-			# connectOnlyOnce does not work here, because sometimes the __dict__ attribute doesn't get persisted properly
+		# connectOnlyOnce does not work here, because sometimes the __dict__ attribute doesn't get persisted properly.
+		# A dynamic Qt property is stored on the C++ side, so it is always persisted:
+		if not selection.property(_ON_INPUT_MODIFIED_CONNECTED_PROPERTY):
 			connectSafe(selection.selectionChanged, lambda x, y: self.OnInputModified(listBox))
+			selection.setProperty(_ON_INPUT_MODIFIED_CONNECTED_PROPERTY, True)
 
 		return listBox.currentIndex().row()
 
@@ -2547,7 +3097,8 @@ class PythonGUI(CatScalableWidgetMixin):
 			table.setModel(DataTableModel(table, headers))
 			connectSafe(table.model().modelReset, lambda: self.OnInputModified(table.model()))
 
-		table.verticalHeader().setVisible(False)
+		verticalHeader = table.verticalHeader()
+		verticalHeader.setVisible(False)
 		table.horizontalHeader().setStretchLastSection(True)
 		table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
 		table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
@@ -2555,7 +3106,8 @@ class PythonGUI(CatScalableWidgetMixin):
 		if table.model().headers != headers:
 			table.model().headers = headers
 			needsReset = True
-		if table.model() != self.modifiedInput[0] and table.model().tableData != data:
+		# the model keeps a reference to data, so the (common) case of the same list being passed again is cheap to detect:
+		if table.model() is not self.modifiedInput[0] and table.model().tableData is not data and table.model().tableData != data:
 			table.model().tableData = data
 			needsReset = True
 
@@ -2563,7 +3115,10 @@ class PythonGUI(CatScalableWidgetMixin):
 			table.model().beginResetModel()
 			table.model().endResetModel()
 
-		tableHeight = sum(table.rowHeight(i) for i in range(min(table.model().rowCount(), 5)))
+		# height of the first (up to) 5 rows. Asks the header for the end of the last of those rows, instead of asking for
+		# the height of every single row:
+		lastRow = min(table.model().rowCount(), 5) - 1
+		tableHeight = verticalHeader.sectionPosition(lastRow) + verticalHeader.sectionSize(lastRow) if lastRow >= 0 else 0
 		table.setMinimumHeight(tableHeight + table.horizontalHeader().height() + 2 + 9)
 
 		return table.model().tableData
@@ -2599,21 +3154,34 @@ class PythonGUI(CatScalableWidgetMixin):
 
 		header = treeWidget.header()
 
+		# the setters below relayout the header, so only call them if something actually changed:
 		if columnResizeModes is not None:
-			header.setStretchLastSection(stretchLastColumn if stretchLastColumn is not ... else False)
-			for i, srm in enumerate(columnResizeModes):
-				header.setSectionResizeMode(i, srm.value)
+			stretchLastSection = stretchLastColumn if stretchLastColumn is not ... else False
+			resizeModes = tuple(srm.value for srm in columnResizeModes)
 		elif headerVisible:
-			header.setStretchLastSection(stretchLastColumn if stretchLastColumn is not ... else True)
-			header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+			stretchLastSection = stretchLastColumn if stretchLastColumn is not ... else True
+			resizeModes = QtWidgets.QHeaderView.Interactive
+		else:
+			stretchLastSection = stretchLastColumn if stretchLastColumn is not ... else False
+			resizeModes = QtWidgets.QHeaderView.ResizeToContents
+
+		if header.stretchLastSection() != stretchLastSection:
+			header.setStretchLastSection(stretchLastSection)
+		# (the getters are cheap and, unlike a cached value, stay correct if the header resets its sections on a model reset)
+		if type(resizeModes) is tuple:
+			for i, resizeMode in enumerate(resizeModes):
+				if header.sectionResizeMode(i) != resizeMode:
+					header.setSectionResizeMode(i, resizeMode)
 		else:
-			header.setStretchLastSection(stretchLastColumn if stretchLastColumn is not ... else False)
-			header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
+			sectionCount = header.count()
+			if sectionCount == 0 or any(header.sectionResizeMode(i) != resizeModes for i in range(sectionCount)):
+				header.setSectionResizeMode(resizeModes)
 
-		# connectOnlyOnce does not work here, because sometimes the __dict__ attribute doesn't get persisted properly:
-		if QtCore.QObject.receivers(selectionModel, selectionModel.selectionChanged) == 2:
-			# connectOnlyOnce does not work here, because sometimes the __dict__ attribute doesn't get persisted properly
+		# connectOnlyOnce does not work here, because sometimes the __dict__ attribute doesn't get persisted properly.
+		# A dynamic Qt property is stored on the C++ side, so it is always persisted:
+		if not selectionModel.property(_ON_INPUT_MODIFIED_CONNECTED_PROPERTY):
 			connectSafe(selectionModel.selectionChanged, lambda new, old: self.OnInputModified(selectionModel))
+			selectionModel.setProperty(_ON_INPUT_MODIFIED_CONNECTED_PROPERTY, True)
 
 		self._connectOnInputModified(treeWidget, treeWidget.dataChanged)
 
@@ -2632,12 +3200,18 @@ class PythonGUI(CatScalableWidgetMixin):
 			progressBar.setValue(value)
 
 		if progressSignal is not None:
-			try:
-				progressSignal.disconnect(progressBar.setValue)
-			except Exception as e:
-				if str(e)[0:19] != "disconnect() failed" and str(e)[9:32] != "object is not connected":
-					raise e
-			connectSafe(progressSignal, progressBar.setValue)
+			# always reconnect: PyQt5 can neither tell whether a QMetaObject.Connection is still alive, nor which object a
+			# bound signal belongs to, so a new emitter at the address of a deleted one can't be told apart from the old one.
+			# Disconnecting via the stored connection never raises, and it actually removes the old connection
+			# (disconnecting progressBar.setValue didn't, because connectSafe connects a wrapper):
+			connection = getattr(progressBar, '_PythonGUI__progressConnection', None)
+			if connection is not None:
+				QObject.disconnect(connection)
+			setValueSlot = getattr(progressBar, '_PythonGUI__setValueSlot', None)
+			if setValueSlot is None:
+				setValueSlot = CrashReportWrapped(progressBar.setValue)
+				setattr(progressBar, '_PythonGUI__setValueSlot', setValueSlot)
+			setattr(progressBar, '_PythonGUI__progressConnection', connectSafe(progressSignal, setValueSlot))
 
 	@overload
 	def customWidget(self, widgetInstance: _TQWidget, label: Optional[str] = None, **kwargs) -> _TQWidget:
@@ -2660,59 +3234,35 @@ class PythonGUI(CatScalableWidgetMixin):
 		return cp
 
 	def enumField(self, value: Enum, label: Optional[str] = None, **kwargs):
-		names = []
-		members = []
-		for name, member in type(value).__members__.items():
-			names.append(name)
-			members.append(member)
-		index = members.index(value)
-
-		index = self.comboBox(index, names, label, **kwargs)
+		names, members, indexByMember = _getEnumChoices(type(value))
+		index = self.comboBox(indexByMember[value], names, label, **kwargs)
 
 		return members[index]
 
 	def vectorField(self, values, label=None, labels=(), decorators=(), tips=(), tip='', kwargs: tuple[dict[str, Any], ...] = (), **commonKWargs):
-		def addSpacers(widgetPainters):
-			try:
-				yield next(widgetPainters)()
-				while True:
-					wp = next(widgetPainters)
-					self.addHSpacer(5, SizePolicy.Minimum)
-					yield wp()
-			except StopIteration as e:
-				return
-
-		def getPainter(type_, decorator):
-			propertyPainter = decorator or getWidgetDrawer(type_)
-			if propertyPainter is None:
-				raise Exception("Unknown property type '{}'.\nCannot draw property".format(type_))
-			return propertyPainter
-
+		# per-component arguments may be arbitrary (even infinite) iterables, so they are consumed lazily:
 		allLabels = itertools.chain(labels, itertools.repeat(None))
 		allTips = itertools.chain(tips, itertools.repeat(tip))
 		allDecorators = itertools.chain(decorators, itertools.repeat(None))
-		allKWargs = itertools.chain(kwargs, itertools.repeat({}))
-		widgetPainters = (lambda: getPainter(type(v), d)(self, v, label=l, tip=t, **commonKWargs, **kwa) for v, l, t, d, kwa in zip(values, allLabels, allTips, allDecorators, allKWargs))
+		allKWargs = itertools.chain(kwargs, itertools.repeat(_EMPTY_KWARGS))
 
+		result = []
 		with self.hLayout(label=label, tip=tip, **commonKWargs):
-			result = tuple(map(lambda v: v, addSpacers(widgetPainters)))
+			for i, (v, l, t, d, kwa) in enumerate(zip(values, allLabels, allTips, allDecorators, allKWargs)):
+				if i:
+					self.addHSpacer(5, SizePolicy.Minimum)
+				propertyPainter = d or getWidgetDrawer(type(v))
+				if propertyPainter is None:
+					raise Exception("Unknown property type '{}'.\nCannot draw property".format(type(v)))
+				result.append(propertyPainter(self, v, label=l, tip=t, **commonKWargs, **kwa))
 			self.addHSpacer(0, SizePolicy.Minimum)
-			return result
+		return tuple(result)
 
 	def valueField(self, value, type_=None, **kwargs):
-		widgetDrawer = None
-		try:
-			typeHint = type_
-			if typeHint.__origin__._name == 'Union':
-				for arg in get_args(typeHint):
-					widgetDrawer = getWidgetDrawer(arg)
-					if widgetDrawer is not None:
-						break
-		except AttributeError:
-			pass
-
-		if widgetDrawer is None:
-			widgetDrawer = getWidgetDrawer(type_ or type(value))
+		if type_ is None:
+			widgetDrawer = getWidgetDrawer(type(value))
+		else:
+			widgetDrawer = _resolveValueFieldDrawer(type_)
 		if widgetDrawer is None:
 			raise Exception(f"Unknown property type '{type_ or type(value)}'.\nCannot draw property")
 		newValue = widgetDrawer(self, value, **kwargs)
@@ -2722,16 +3272,17 @@ class PythonGUI(CatScalableWidgetMixin):
 _TPythonGUI = TypeVar('_TPythonGUI', bound=PythonGUI)
 
 
-addWidgetDrawer(str, lambda gui, v, **kwargs: gui.textField(v, **kwargs))
-addWidgetDrawer(int, lambda gui, v, **kwargs: gui.intField(v, **kwargs))
-addWidgetDrawer(float, lambda gui, v, **kwargs: gui.floatField(v, **kwargs))
-addWidgetDrawer(bool, lambda gui, v, **kwargs: gui.checkbox(v, **kwargs))
-addWidgetDrawer(ToggleCheckState, lambda gui, v, **kwargs: gui.checkbox(v, returnTristate=True, **kwargs))
-addWidgetDrawer(Enum, lambda gui, v, **kwargs: gui.enumField(v, **kwargs))
-addWidgetDrawer(list, lambda gui, v, **kwargs: gui.stringTable(v, **kwargs))
-addWidgetDrawer(set, lambda gui, v, **kwargs: set(gui.stringTable(list(v), **kwargs)))
-addWidgetDrawer(tuple, lambda gui, v, **kwargs: gui.vectorField(v, **kwargs))
-addWidgetDrawer(QFont, lambda gui, v, **kwargs: gui.fontComboBox(v, **kwargs))
+if not _MODULE_INITIALIZED:
+	addWidgetDrawer(str, lambda gui, v, **kwargs: gui.textField(v, **kwargs))
+	addWidgetDrawer(int, lambda gui, v, **kwargs: gui.intField(v, **kwargs))
+	addWidgetDrawer(float, lambda gui, v, **kwargs: gui.floatField(v, **kwargs))
+	addWidgetDrawer(bool, lambda gui, v, **kwargs: gui.checkbox(v, **kwargs))
+	addWidgetDrawer(ToggleCheckState, lambda gui, v, **kwargs: gui.checkbox(v, returnTristate=True, **kwargs))
+	addWidgetDrawer(Enum, lambda gui, v, **kwargs: gui.enumField(v, **kwargs))
+	addWidgetDrawer(list, lambda gui, v, **kwargs: gui.stringTable(v, **kwargs))
+	addWidgetDrawer(set, lambda gui, v, **kwargs: set(gui.stringTable(list(v), **kwargs)))
+	addWidgetDrawer(tuple, lambda gui, v, **kwargs: gui.vectorField(v, **kwargs))
+	addWidgetDrawer(QFont, lambda gui, v, **kwargs: gui.fontComboBox(v, **kwargs))
 
 
 class PythonGUIWidget(QWidget, CatSizePolicyMixin, CatFramedWidgetMixin, Generic[_TPythonGUI]):
@@ -3067,3 +3618,6 @@ class MessageDialog(CatFramelessWindowMixin[_TPythonGUI], QDialog, Generic[_TPyt
 
 def _toQDate(pyDate: date) -> QtCore.QDate:
 	return QtCore.QDate.fromString(str(pyDate), 'yyyy-MM-dd')
+
+
+_MODULE_INITIALIZED = True
@@ -1,5 +1,4 @@
-from collections import defaultdict
-from typing import Callable, DefaultDict, Dict, Optional, Union
+from typing import Callable, Dict, Optional, Union
 
 from PyQt5 import sip
 from PyQt5.QtCore import QObject, pyqtBoundSignal, pyqtSignal
@@ -15,7 +14,7 @@ def connectUnsafe(signal, slot):
 
 
 def connectSafe(signal, slot):
-	return signal.connect(CrashReportWrapped(slot))
+	return signal.connect(slot if isCrashReportWrapped(slot) else CrashReportWrapped(slot))
 
 
 def disconnect(obj: QObject | pyqtSignal):
@@ -27,6 +26,19 @@ def disconnect(obj: QObject | pyqtSignal):
 		pass
 
 
+_pendingDeleteLater: list[QObject] = []
+
+
+def _drainPendingDeleteLater() -> None:
+	global _pendingDeleteLater
+	pending = _pendingDeleteLater
+	_pendingDeleteLater = []
+	isdeleted = sip.isdeleted
+	for obj in pending:
+		if not isdeleted(obj):
+			obj.deleteLater()
+
+
 def disconnectAndDeleteLater(obj: QObject):
 	try:
 		obj.disconnect()
@@ -35,7 +47,10 @@ def disconnectAndDeleteLater(obj: QObject):
 		logDebug(f"  {e}")
 		pass
 
-	runLaterSafe(10, lambda: obj.deleteLater() if not sip.isdeleted(obj) else None)  # bad practice, but necessary in order to reasonably make sure that all signals have been handled :'(
+	# all objects disconnected within the same ~10 ms share a single timer:
+	if not _pendingDeleteLater:
+		runLaterSafe(10, _drainPendingDeleteLater)  # bad practice, but necessary in order to reasonably make sure that all signals have been handled :'(
+	_pendingDeleteLater.append(obj)
 
 
 def disconnectAndDeleteImmediately(obj: QObject):
@@ -61,37 +76,67 @@ def connectOnlyOnce(obj: QObject, signal: pyqtBoundSignal | pyqtSignal, slot: QT
 	# pyqtSignal is in the type signature, only to make pycharms typechecker happy.
 	assert slotID is not None, "slotID must NOT be None!"
 	assert not isinstance(signal, pyqtSignal), "expected a bound signal (pyqtBoundSignal), but got pyqtSignal."
-	connectedSlotsAttrName = '__catConnectedSlots__'
-	connectedSlots: Optional[DefaultDict[str, Dict[QTSlotID, QTSlot]]] = getattr(obj, connectedSlotsAttrName, None)
-
-	if connectedSlots is None:
-		connectedSlots = defaultdict(dict)
-		setattr(obj, connectedSlotsAttrName, connectedSlots)
+	connectedSlots: Dict[str, Dict[QTSlotID, QTSlot]]
+	try:
+		connectedSlots = obj.__catConnectedSlots__
+	except AttributeError:
+		connectedSlots = obj.__catConnectedSlots__ = {}
 
-	slotsForSignal = connectedSlots[signal.signal]
+	sigKey = signal.signal
+	slotsForSignal = connectedSlots.setdefault(sigKey, {})
 	if slotID not in slotsForSignal:
 		slotsForSignal[slotID] = slot
 		connectSafe(signal, slot)
 
 
+def isConnectedOnce(obj: QObject, signal: pyqtBoundSignal | pyqtSignal, slotID: QTSlotID) -> bool:
+	"""returns True, if a slot with slotID has already been connected to signal using connectOnlyOnce(...)."""
+	connectedSlots: Optional[Dict[str, Dict[QTSlotID, QTSlot]]] = getattr(obj, '__catConnectedSlots__', None)
+	if connectedSlots is None:
+		return False
+	slotsForSignal = connectedSlots.get(signal.signal)
+	return slotsForSignal is not None and slotID in slotsForSignal
+
+
 def saveDisconnect(obj: QObject, signal: pyqtBoundSignal, slotID: QTSlotID):
 	assert slotID is not None, "slotID must NOT be None!"
 	assert not isinstance(signal, pyqtSignal), "expected a bound signal (pyqtBoundSignal), but got pyqtSignal."
 	connectedSlotsAttrName = '__catConnectedSlots__'
-	connectedSlots: Optional[DefaultDict[str, Dict[QTSlotID, QTSlot]]] = getattr(obj, connectedSlotsAttrName, None)
+	connectedSlots: Optional[Dict[str, Dict[QTSlotID, QTSlot]]] = getattr(obj, connectedSlotsAttrName, None)
 
 	if connectedSlots is None:
 		return
 
-	if signal.signal in connectedSlots:
-		slotsForSignal = connectedSlots[signal.signal]
+	slotsForSignal = connectedSlots.get(signal.signal)
+	if slotsForSignal is not None:
 		if slotID in slotsForSignal:
 			slot = slotsForSignal[slotID]
 			signal.disconnect(slot)
 			del slotsForSignal[slotID]
 
 
+_isdeleted = sip.isdeleted
+
+
 def safeEmit(self: QObject, signal: Union[pyqtBoundSignal, pyqtSignal], *args) -> None:
-	if not sip.isdeleted(self):
+	if not _isdeleted(self):
 		signal.emit(*args)
 
+
+def safeEmit0(self: QObject, signal: Union[pyqtBoundSignal, pyqtSignal]) -> None:
+	"""same as safeEmit(self, signal), but without packing the arguments into a tuple."""
+	if not _isdeleted(self):
+		signal.emit()
+
+
+def safeEmit1(self: QObject, signal: Union[pyqtBoundSignal, pyqtSignal], a) -> None:
+	"""same as safeEmit(self, signal, a), but without packing the arguments into a tuple."""
+	if not _isdeleted(self):
+		signal.emit(a)
+
+
+def safeEmit2(self: QObject, signal: Union[pyqtBoundSignal, pyqtSignal], a, b) -> None:
+	"""same as safeEmit(self, signal, a, b), but without packing the arguments into a tuple."""
+	if not _isdeleted(self):
+		signal.emit(a, b)
+
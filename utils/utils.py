@@ -164,9 +164,10 @@ if True:
 			try:
 				return func(*args, **kwargs)
 			except Exception as e:
-				print(format_full_exc())
+				excStr = format_full_exc()
+				print(excStr)
 				from cat.utils.logging_ import logError
-				logError(format_full_exc())
+				logError(excStr)
 				onCrash(e)
 				raise
 		call.__CrashReportWrapped__ = True